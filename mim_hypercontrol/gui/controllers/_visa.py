@@ -0,0 +1,98 @@
+"""
+================
+Title: Shared VISA resource manager
+Author: Philip David Suh and Siyuan Qiu
+Institution: Stanford University, Department of Physics
+=================
+"""
+import threading
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
+
+_rm = None
+_rm_lock = threading.Lock()
+# pyvisa sessions are not thread-safe, so all worker-thread I/O goes through one lock
+_io_lock = threading.Lock()
+
+
+def get_rm():
+    '''return the process-wide pyvisa ResourceManager, creating it on first use'''
+    global _rm
+    if _rm is None:
+        with _rm_lock:
+            if _rm is None:
+                import pyvisa
+                _rm = pyvisa.ResourceManager()
+    return _rm
+
+
+class ResourceScannerSignals(QObject):
+    finished = pyqtSignal(list)
+
+
+class ResourceScanner(QRunnable):
+    '''run get_rm().list_resources() on a worker thread and emit the result'''
+    def __init__(self):
+        super().__init__()
+        self.signals = ResourceScannerSignals()
+
+    def run(self):
+        try:
+            resources = list(get_rm().list_resources())
+        except Exception as e:
+            print(f"❌ Failed to list VISA resources: {e}")
+            resources = []
+        try:
+            self.signals.finished.emit(resources)
+        except RuntimeError:
+            # the window (and its signals object) was destroyed while we were scanning
+            pass
+
+
+class VisaWorkerSignals(QObject):
+    result = pyqtSignal(object)
+    error = pyqtSignal(str)
+
+
+class VisaWorker(QRunnable):
+    '''run fn(*args) on the thread pool under the shared VISA lock and emit the result'''
+    def __init__(self, fn, *args):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.signals = VisaWorkerSignals()
+
+    def run(self):
+        try:
+            with _io_lock:
+                result = self.fn(*self.args)
+        except Exception as e:
+            signal, value = self.signals.error, str(e)
+        else:
+            signal, value = self.signals.result, result
+        try:
+            signal.emit(value)
+        except RuntimeError:
+            pass
+
+
+class LockedInstrument:
+    '''wrap an instrument driver so every method call holds the instrument's own lock,
+    letting the GUI thread and a poller thread share one connection'''
+    def __init__(self, inst):
+        self._inst = inst
+        self._lock = threading.RLock()
+
+    def __getattr__(self, name):
+        attr = getattr(self._inst, name)
+        if not callable(attr):
+            return attr
+        lock = self._lock
+
+        def locked(*args, **kwargs):
+            with lock:
+                return attr(*args, **kwargs)
+        return locked
+
+    def __dir__(self):
+        # attribute listings describe the driver, not the proxy
+        return dir(self._inst)
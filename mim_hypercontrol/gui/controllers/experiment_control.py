@@ -0,0 +1,132 @@
+"""
+================
+Title: Measurement Control GUI
+Author: Siyuan Qiu
+Create Date: 2024/12/26
+Institution: Stanford University, Department of Physics
+Adapted from https://pymeasure.readthedocs.io/en/stable/tutorial/graphical.html
+=================
+"""
+
+import logging
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+from PyQt5.QtWidgets import (QFrame, QLabel, QComboBox, QCheckBox, QPushButton, QMessageBox,
+                             QGridLayout)
+from PyQt5.QtCore import Qt
+
+# pymeasure and numpy are only needed once an experiment window is opened, so
+# MIMProcedure and ExperimentControl live in experiment_procedure and are
+# imported on first use rather than when the main window starts up.
+def __getattr__(name):
+    if name in ("MIMProcedure", "ExperimentControl"):
+        from . import experiment_procedure
+        return getattr(experiment_procedure, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+class CreateExperiment(QFrame):
+    def __init__(self):
+        super().__init__()
+        self.setGeometry(500, 500, 500, 200)
+        self._experimentControl = None
+        self.initUI()
+        # self.show()
+
+    @property
+    def experimentControl(self):
+        # build the default experiment window the first time it is requested
+        if self._experimentControl is None:
+            from .experiment_procedure import MIMProcedure, ExperimentControl
+            self._experimentControl = ExperimentControl(MIMProcedure, False, ['1st Param Range', '1st Param Delay Time', '1st Param'])
+        return self._experimentControl
+
+    @experimentControl.setter
+    def experimentControl(self, value):
+        self._experimentControl = value
+
+    def initUI(self):
+        # create main grid to organize layout
+        main_grid = QGridLayout()
+        main_grid.setSpacing(10)
+        self.setLayout(main_grid)
+        self.setWindowTitle("Create Experiment")
+
+        scan_lb = QLabel("Scan Geometry")
+        main_grid.addWidget(scan_lb, 0, 0, 1, 1, Qt.AlignCenter)
+        self.scan_geo_cb = QComboBox()
+        self.scan_geo_cb.addItems(["Point", "Multiple Points", "Line", "Plane"])
+        main_grid.addWidget(self.scan_geo_cb, 1, 0, 1, 1, Qt.AlignCenter)
+
+        first_param_lb = QLabel("1st Param")
+        main_grid.addWidget(first_param_lb, 0, 1, 1, 1, Qt.AlignCenter)
+        self.first_param_cb = QComboBox()
+        self.first_param_cb.addItems(["Bottom Gate", "Top Gate", "DS Voltage", "Magnetic Field", "Temperature"])
+        main_grid.addWidget(self.first_param_cb, 1, 1, 1, 1, Qt.AlignCenter)
+
+        self.second_param_cb = QComboBox()
+        self.second_param_cb.setEnabled(False)
+        self.second_param_cb.addItems(["Bottom Gate", "Top Gate", "DS Voltage", "Magnetic Field", "Temperature"])
+        main_grid.addWidget(self.second_param_cb, 1, 2, 1, 1, Qt.AlignCenter)
+        self.second_param_chb = QCheckBox("2nd Param")
+        self.second_param_chb.stateChanged.connect(self.toggle2ndParam)
+        main_grid.addWidget(self.second_param_chb, 0, 2, 1, 1, Qt.AlignCenter)
+
+        self.create_btn = QPushButton("Create")
+        self.create_btn.clicked.connect(self.create_experiment)
+        main_grid.addWidget(self.create_btn, 2, 2, 1, 1, Qt.AlignCenter)
+
+    def toggle2ndParam(self):
+        if self.second_param_chb.isChecked():
+            self.second_param_cb.setEnabled(True)
+        else:
+            self.second_param_cb.setEnabled(False)
+
+    def create_experiment(self):
+        if self.second_param_chb.isChecked() and (self.first_param_cb.currentText() == self.second_param_cb.currentText()):
+            QMessageBox.warning(self, "Fail to create", "Cannot use the same parameter!")
+            return
+        buttonReply = QMessageBox.question(self, 'Create experiment', "Are you sure to create a new experiment?",
+                                           QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
+        if buttonReply == QMessageBox.No:
+            return
+
+        from pymeasure.experiment import FloatParameter, Parameter
+        from .experiment_procedure import MIMProcedure, ExperimentControl, _parse_range
+
+        if self.scan_geo_cb.currentText() == "Point":
+            MIMProcedure.position = Parameter('Position', default='[0,0]')
+        # Need to implement similar argument for other geometries
+
+        MIMProcedure.first_param_range = Parameter('{} Range'.format(self.first_param_cb.currentText()), default='range(0, 101, 1)')
+        MIMProcedure.first_param_delay = FloatParameter('{} Delay Time'.format(self.first_param_cb.currentText()), units='s', default=0.2)
+        parsed = _parse_range(MIMProcedure.first_param_range.value)
+        if parsed is not None:
+            start, stop, step, MIMProcedure.first_param_range_np = parsed
+            setattr(MIMProcedure, '{}_start'.format(self.first_param_cb.currentText()), start)
+            setattr(MIMProcedure, '{}_end'.format(self.first_param_cb.currentText()), stop)
+            setattr(MIMProcedure, '{}_step'.format(self.first_param_cb.currentText()), step)
+        MIMProcedure.use_second_param = self.second_param_chb.isChecked()
+        if self.second_param_chb.isChecked():
+            MIMProcedure.second_param_range = Parameter('{} Range'.format(self.second_param_cb.currentText()),
+                                                        default='range(0, 101, 1)')
+            MIMProcedure.second_param_delay = FloatParameter('{} Delay Time'.format(self.second_param_cb.currentText()),
+                                                             units='s', default=0.2)
+            parsed = _parse_range(MIMProcedure.second_param_range.value)
+            if parsed is not None:
+                start, stop, step, MIMProcedure.second_param_range_np = parsed
+                setattr(MIMProcedure, '{}_start'.format(self.second_param_cb.currentText()), start)
+                setattr(MIMProcedure, '{}_end'.format(self.second_param_cb.currentText()), stop)
+                setattr(MIMProcedure, '{}_step'.format(self.second_param_cb.currentText()), step)
+            MIMProcedure.DATA_COLUMNS = [self.first_param_cb.currentText(),
+                                         self.second_param_cb.currentText(),
+                                         "Result"]
+
+            self.experimentControl = ExperimentControl(MIMProcedure, self.second_param_chb.isChecked(), [self.first_param_cb.currentText(),
+                                                        self.second_param_cb.currentText(), 'Result'])
+        else:
+            MIMProcedure.DATA_COLUMNS = [self.first_param_cb.currentText(), "Result"]
+            self.experimentControl = ExperimentControl(MIMProcedure, self.second_param_chb.isChecked(), [self.first_param_cb.currentText(),
+                                                        'Result'])
+        self.experimentControl.show()
@@ -0,0 +1,237 @@
+"""
+================
+Title: Measurement Procedure
+Author: Siyuan Qiu
+Create Date: 2024/12/26
+Institution: Stanford University, Department of Physics
+Adapted from https://pymeasure.readthedocs.io/en/stable/tutorial/graphical.html
+=================
+"""
+
+import logging
+log = logging.getLogger(__name__)
+log.addHandler(logging.NullHandler())
+
+import math
+import re
+from time import sleep
+from pymeasure.display.windows import ManagedWindowBase
+from pymeasure.display.widgets import LogWidget, PlotWidget, ImageWidget
+from pymeasure.experiment import Procedure
+from pymeasure.experiment import FloatParameter, Parameter
+import numpy as np
+
+_RANGE_RE = re.compile(r"^range\(\s*([^,]+),\s*([^,]+),\s*([^)]+)\)\s*$")
+
+
+def _parse_range(spec):
+    '''parse "range(start, stop, step)" into (start, stop, step, values), or None if spec is not a range'''
+    match = _RANGE_RE.match(spec)
+    if match is None:
+        return None
+    start, stop, step = map(float, match.groups())
+    if step == 0:
+        raise ValueError(f"range step must not be zero: {spec}")
+    # like range(): every start + i*step short of stop; the explicit count (with a little
+    # slack for float division) avoids np.arange's float-step off-by-one
+    n = max(math.ceil((stop - start) / step - 1e-9), 0)
+    return start, stop, step, (start + step * np.arange(n)).astype(np.float32)
+
+
+class MIMProcedure(Procedure):
+
+    position = Parameter('Position', default='[0,0]')
+    first_param_range = Parameter('1st Param Range', default='range(0, 101, 1)')
+    first_param_delay = FloatParameter('1st Param Delay Time', units='s', default=0.2)
+    first_param_range_np = _parse_range('range(0, 101, 1)')[3]
+    use_second_param = False
+    second_param_range = Parameter('2nd Param Range', default='range(0, 101, 1)')
+    second_param_delay = FloatParameter('2nd Param Delay Time', units='s', default=0.2)
+    second_param_range_np = _parse_range('range(0, 101, 1)')[3]
+
+    DATA_COLUMNS = ['1st Param', 'Result']
+
+    def startup(self):
+        log.info("Setting up the parameters")
+        self._apply_range(self.first_param_range, self.DATA_COLUMNS[0], 'first_param_range_np')
+        if self.use_second_param:
+            self._apply_range(self.second_param_range, self.DATA_COLUMNS[1], 'second_param_range_np')
+
+    def _apply_range(self, spec, name, attr):
+        parsed = _parse_range(spec)
+        if parsed is None:
+            return
+        start, stop, step, values = parsed
+        setattr(self, '{}_start'.format(name), start)
+        setattr(self, '{}_end'.format(name), stop)
+        setattr(self, '{}_step'.format(name), step)
+        setattr(self, attr, values)
+
+    def execute(self):
+        log.info("Starting the loop")
+        first_range = self.first_param_range_np
+        second_range = self.second_param_range_np if self.use_second_param else None
+        n1 = len(first_range)
+        n2 = len(second_range) if self.use_second_param else 1
+        # progress in percent per emitted point, computed once instead of per iteration
+        inv = 100.0 / (n1 * n2) if n1 else 0.0
+        columns = self.DATA_COLUMNS
+        c0, c1 = columns[0], columns[1]
+        # Add commands to move the tip, or config scanning mode
+        for i, x in enumerate(first_range):
+            log.debug('%s: %g', c0, x)
+            if self.use_second_param:
+                c2 = columns[2]
+                for j, y in enumerate(second_range):
+                    log.debug('%s: %g', c1, y)
+                    progress = (n2 * i + j) * inv
+                    data = {
+                        c0: x,
+                        c1: y,  # Measurement result
+                        c2: progress
+                    }
+                    self.emit('results', data)
+                    log.debug("Emitting results: %s", data)
+                    self.emit('progress', progress)
+                    sleep(self.second_param_delay)
+                    if self.should_stop():
+                        log.warning("Caught the stop flag in the procedure")
+                        break
+                sleep(self.first_param_delay)
+                if self.should_stop():
+                    # log.warning("Caught the stop flag in the procedure")
+                    break
+            else:
+                data = {
+                    c0: x,
+                    c1: i # Measurement result
+                }
+                self.emit('results', data)
+                log.debug("Emitting results: %s", data)
+                self.emit('progress', i * inv)
+                sleep(self.first_param_delay)
+                if self.should_stop():
+                    log.warning("Caught the stop flag in the procedure")
+                    break
+
+    # def get_estimates(self, sequence_length=None, sequence=None):
+    #     from datetime import datetime, timedelta
+    #
+    #     if self.use_second_param:
+    #         duration = len(self.first_param_range_np) * (len(self.second_param_range_np) * self.second_param_delay + self.first_param_delay)
+    #         estimates = [
+    #             ("Duration", "%d s" % int(duration)),
+    #             ("Number of 1st param", "%d" % int(len(self.first_param_range_np))),
+    #             ("Number of 2nd param", "%d" % int(len(self.second_param_range_np))),
+    #             ("Sequence length", str(sequence_length)),
+    #             ('Measurement finished at', str(datetime.now() + timedelta(seconds=duration))),
+    #         ]
+    #     else:
+    #         duration = len(self.first_param_range_np) * self.first_param_delay
+    #         estimates = [
+    #             ("Duration", "%d s" % int(duration)),
+    #             ("Number of 1st param", "%d" % int(len(self.first_param_range_np))),
+    #             ("Sequence length", str(sequence_length)),
+    #             ('Measurement finished at', str(datetime.now() + timedelta(seconds=duration))),
+    #         ]
+    #
+    #     return estimates
+
+class ExperimentControl(ManagedWindowBase):
+
+    def __init__(self, procedure_class, use_second_param, inputs):
+        if use_second_param:
+            widget_list = (ImageWidget("Experiment Image",
+                                       MIMProcedure.DATA_COLUMNS,
+                                       x_axis=inputs[0],
+                                       y_axis=inputs[1],
+                                       z_axis=inputs[2]
+                                       ),
+                           PlotWidget("Experiment Plot",
+                                       MIMProcedure.DATA_COLUMNS,
+                                      x_axis=inputs[0],
+                                      y_axis=inputs[2]
+                                       ),
+                           LogWidget("Experiment Log"),
+                           )
+            super().__init__(
+                procedure_class=procedure_class,
+                inputs=['first_param_range', 'first_param_delay', 'second_param_range', 'second_param_delay'],
+                displays=['first_param_range', 'first_param_delay', 'second_param_range', 'second_param_delay'],
+                sequencer = True,  # Added line
+                sequencer_inputs = ['first_param_range', 'first_param_delay', 'second_param_range', 'second_param_delay'],  # Added line
+                widget_list=widget_list
+                # sequence_file = "gui_sequencer_example_sequence.txt",  # Added line, optional
+            )
+            logging.getLogger().addHandler(widget_list[2].handler)
+            log.setLevel(self.log_level)
+            log.info("ManagedWindow connected to logging")
+        else:
+            widget_list = (PlotWidget("Experiment Plot",
+                                      MIMProcedure.DATA_COLUMNS,
+                                      x_axis=inputs[0],
+                                      y_axis=inputs[1]
+                                      ),
+                           LogWidget("Experiment Log"),
+                           )
+            super().__init__(
+                procedure_class=MIMProcedure,
+                inputs=['first_param_range', 'first_param_delay'],
+                displays=['first_param_range', 'first_param_delay'],
+                sequencer=True,  # Added line
+                sequencer_inputs=['first_param_range', 'first_param_delay'],  # Added line
+                widget_list = widget_list
+            # sequence_file = "gui_sequencer_example_sequence.txt",  # Added line, optional
+            )
+            logging.getLogger().addHandler(widget_list[1].handler)
+            log.setLevel(self.log_level)
+            log.info("ManagedWindow connected to logging")
+        self.setWindowTitle('MIM Experiment GUI')
+        self.setGeometry(100, 100, 2000, 1400)
+        # super().plot_widget.columns_x_label.setMinimumWidth(100)
+        # super().plot_widget.columns_y_label.setMinimumWidth(100)
+
+        self.filename = r'default_filename_delay{Delay Time:4f}s'  # Sets default filename
+        self.directory = r'C:/Path/to/default/directory'  # Sets default directory
+        self.store_measurement = False  # Controls the 'Save data' toggle
+        self.file_input.extensions = ["csv", "txt",
+                                      "data"]  # Sets recognized extensions, first entry is the default extension
+        self.file_input.filename_fixed = False  # Controls whether the filename-field is frozen (but still displayed)
+
+# class ExperimentControl(ManagedWindow):
+#
+#     def __init__(self, procedure_class, use_second_param, inputs):
+#         # Check how procedure class is called by ManagedWindow
+#         if use_second_param:
+#             super().__init__(
+#                 procedure_class=procedure_class,
+#                 inputs=['first_param_range', 'first_param_delay', 'second_param_range', 'second_param_delay'],
+#                 displays=['first_param_range', 'first_param_delay', 'second_param_range', 'second_param_delay'],
+#                 x_axis=inputs[0],
+#                 y_axis=inputs[2],
+#                 sequencer = True,  # Added line
+#                 sequencer_inputs = ['first_param_range', 'first_param_delay', 'second_param_range', 'second_param_delay']  # Added line
+#                 # sequence_file = "gui_sequencer_example_sequence.txt",  # Added line, optional
+#             )
+#         else:
+#             super().__init__(
+#                 procedure_class=MIMProcedure,
+#                 inputs=['first_param_range', 'first_param_delay'],
+#                 displays=['first_param_range', 'first_param_delay'],
+#                 x_axis=inputs[0],
+#                 y_axis=inputs[2],
+#                 sequencer=True,  # Added line
+#                 sequencer_inputs=['first_param_range', 'first_param_delay']  # Added line
+#             # sequence_file = "gui_sequencer_example_sequence.txt",  # Added line, optional
+#             )
+#         self.setWindowTitle('GUI Example')
+#         self.setGeometry(100, 100, 2000, 1400)
+#         # super().plot_widget.columns_x_label.setMinimumWidth(100)
+#         # super().plot_widget.columns_y_label.setMinimumWidth(100)
+#
+#         self.filename = r'default_filename_delay{Delay Time:4f}s'  # Sets default filename
+#         self.directory = r'C:/Path/to/default/directory'  # Sets default directory
+#         self.store_measurement = False  # Controls the 'Save data' toggle
+#         self.file_input.extensions = ["csv", "txt",
+#                                       "data"]  # Sets recognized extensions, first entry is the default extension
+#         self.file_input.filename_fixed = False  # Controls whether the filename-field is frozen (but still displayed)
\ No newline at end of file
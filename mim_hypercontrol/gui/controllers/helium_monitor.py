@@ -6,17 +6,13 @@ Create Date: 2025/03/24
 Institution: Stanford University, Department of Physics
 =================
 """
-from PyQt5.QtWidgets import *
-from PyQt5.QtGui import *
-from PyQt5.QtCore import *
+from PyQt5.QtWidgets import (QApplication, QFrame, QLabel, QComboBox, QPushButton, QSpinBox,
+                             QVBoxLayout, QHBoxLayout, QAbstractButton)
+from PyQt5.QtGui import QFont, QColor, QPainter, QPen, QBrush, QRadialGradient, QPixmap
+from PyQt5.QtCore import Qt, QPointF, QTimer, QThreadPool, pyqtProperty
 import pyqtgraph as pg
+from ._visa import ResourceScanner
 import sys
-import matplotlib
-matplotlib.use("Qt5Agg")
-matplotlib.rcParams['savefig.dpi'] = 600
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.backends.backend_qt5agg import NavigationToolbar2QT as NavigationToolbar
-import pyvisa as visa
 
 class HeliumMonitor(QFrame):
     def __init__(self):
@@ -26,10 +22,6 @@ class HeliumMonitor(QFrame):
         self.show()
 
     def initUI(self):
-        # create resource manager to connect to the instrument and store resources in a list
-        rm = visa.ResourceManager()
-        resources = rm.list_resources()
-
         # create main grid to organize layout
         main_grid = QVBoxLayout()
         main_grid.setSpacing(10)
@@ -52,7 +44,6 @@ class HeliumMonitor(QFrame):
         visa_vb = QVBoxLayout()
         visa_lb = QLabel("VISA")
         self.visa_cb = QComboBox()
-        self.visa_cb.addItems(resources)
         visa_vb.addWidget(visa_lb)
         visa_vb.addWidget(self.visa_cb)
         connect_hb.addLayout(visa_vb)
@@ -110,11 +101,28 @@ class HeliumMonitor(QFrame):
         main_grid.addLayout(main_hb)
         main_grid.addWidget(self.helium_level_plot)
 
+        # list VISA resources once the window is up instead of blocking construction
+        QTimer.singleShot(0, self._populate_visa)
+
+    def _populate_visa(self):
+        # the shared resource manager is created and enumerated off the GUI thread
+        self._resource_scanner = ResourceScanner()
+        self._resource_scanner.signals.finished.connect(self.visa_cb.addItems)
+        QThreadPool.globalInstance().start(self._resource_scanner)
+
 
 # from https://github.com/nlamprian/pyqt5-led-indicator-widget/blob/master/LedIndicatorWidget.py
 class QLedIndicator(QAbstractButton):
     scaledSize = 1000.0
 
+    # (on_color_1, on_color_2, off_color_1, off_color_2), shared by every indicator
+    _PALETTES = {
+        'red': (QColor(255, 0, 0), QColor(192, 0, 0), QColor(28, 0, 0), QColor(128, 0, 0)),
+        'orange': (QColor(255, 175, 0), QColor(170, 115, 0), QColor(90, 60, 0), QColor(150, 100, 0)),
+        'green': (QColor(0, 255, 0), QColor(0, 192, 0), QColor(0, 28, 0), QColor(0, 128, 0)),
+    }
+    _pen = QPen(Qt.black, 1)
+
     def __init__(self, color='green', parent=None):  # added a color option to use red or orange
         QAbstractButton.__init__(self, parent)
 
@@ -124,54 +132,48 @@ class QLedIndicator(QAbstractButton):
         # prevent user from changing indicator color by clicking
         self.setEnabled(False)
 
-        if color.lower() == 'red':
-            self.on_color_1 = QColor(255, 0, 0)
-            self.on_color_2 = QColor(192, 0, 0)
-            self.off_color_1 = QColor(28, 0, 0)
-            self.off_color_2 = QColor(128, 0, 0)
-        elif color.lower() == 'orange':
-            self.on_color_1 = QColor(255, 175, 0)
-            self.on_color_2 = QColor(170, 115, 0)
-            self.off_color_1 = QColor(90, 60, 0)
-            self.off_color_2 = QColor(150, 100, 0)
-        else:  # default to green if user does not give valid option
-            self.on_color_1 = QColor(0, 255, 0)
-            self.on_color_2 = QColor(0, 192, 0)
-            self.off_color_1 = QColor(0, 28, 0)
-            self.off_color_2 = QColor(0, 128, 0)
+        # default to green if user does not give valid option
+        self.on_color_1, self.on_color_2, self.off_color_1, self.off_color_2 = \
+            self._PALETTES.get(color.lower(), self._PALETTES['green'])
+
+        # rendered LEDs keyed by (size, checked), only rebuilt on resize or color change
+        self._cache = {}
+        self._buildGradients()
+
+    def _buildGradients(self):
+        self.on_gradient = QRadialGradient(QPointF(-500, -500), 1500, QPointF(-500, -500))
+        self.on_gradient.setColorAt(0, self.on_color_1)
+        self.on_gradient.setColorAt(1, self.on_color_2)
+        self.off_gradient = QRadialGradient(QPointF(500, 500), 1500, QPointF(500, 500))
+        self.off_gradient.setColorAt(0, self.off_color_1)
+        self.off_gradient.setColorAt(1, self.off_color_2)
+        self._cache.clear()
 
     def changeColor(self, color):
         '''change color by inputting a string only for red, orange, and green'''
-        if color.lower() == 'red':
-            self.on_color_1 = QColor(255, 0, 0)
-            self.on_color_2 = QColor(192, 0, 0)
-            self.off_color_1 = QColor(28, 0, 0)
-            self.off_color_2 = QColor(128, 0, 0)
-        elif color.lower() == 'orange':
-            self.on_color_1 = QColor(255, 175, 0)
-            self.on_color_2 = QColor(170, 115, 0)
-            self.off_color_1 = QColor(90, 60, 0)
-            self.off_color_2 = QColor(150, 100, 0)
-        elif color.lower() == 'green':
-            self.on_color_1 = QColor(0, 255, 0)
-            self.on_color_2 = QColor(0, 192, 0)
-            self.off_color_1 = QColor(0, 28, 0)
-            self.off_color_2 = QColor(0, 128, 0)
+        if color.lower() not in self._PALETTES:
+            return
+        self.on_color_1, self.on_color_2, self.off_color_1, self.off_color_2 = self._PALETTES[color.lower()]
 
+        self._buildGradients()
         self.update()
 
     def resizeEvent(self, QResizeEvent):
+        self._cache.clear()
         self.update()
 
-    def paintEvent(self, QPaintEvent):
-        realSize = min(self.width(), self.height())
+    def _render(self, realSize, checked):
+        '''draw the LED once into a transparent pixmap of the given size'''
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(int(realSize * ratio), int(realSize * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
 
-        painter = QPainter(self)
-        pen = QPen(Qt.black)
-        pen.setWidth(1)
+        painter = QPainter(pixmap)
+        pen = self._pen
 
         painter.setRenderHint(QPainter.Antialiasing)
-        painter.translate(self.width() / 2, self.height() / 2)
+        painter.translate(realSize / 2, realSize / 2)
         painter.scale(realSize / self.scaledSize, realSize / self.scaledSize)
 
         gradient = QRadialGradient(QPointF(-500, -500), 1500, QPointF(-500, -500))
@@ -189,17 +191,24 @@ class QLedIndicator(QAbstractButton):
         painter.drawEllipse(QPointF(0, 0), 450, 450)
 
         painter.setPen(pen)
-        if self.isChecked():
-            gradient = QRadialGradient(QPointF(-500, -500), 1500, QPointF(-500, -500))
-            gradient.setColorAt(0, self.on_color_1)
-            gradient.setColorAt(1, self.on_color_2)
-        else:
-            gradient = QRadialGradient(QPointF(500, 500), 1500, QPointF(500, 500))
-            gradient.setColorAt(0, self.off_color_1)
-            gradient.setColorAt(1, self.off_color_2)
-
-        painter.setBrush(gradient)
+        painter.setBrush(self.on_gradient if checked else self.off_gradient)
         painter.drawEllipse(QPointF(0, 0), 400, 400)
+        painter.end()
+        return pixmap
+
+    def paintEvent(self, QPaintEvent):
+        realSize = min(self.width(), self.height())
+        if realSize <= 0:
+            return
+
+        key = (realSize, self.isChecked())
+        pixmap = self._cache.get(key)
+        if pixmap is None:
+            pixmap = self._render(realSize, self.isChecked())
+            self._cache[key] = pixmap
+
+        painter = QPainter(self)
+        painter.drawPixmap((self.width() - realSize) // 2, (self.height() - realSize) // 2, pixmap)
 
     @pyqtProperty(QColor)
     def onColor1(self):
@@ -208,6 +217,7 @@ class QLedIndicator(QAbstractButton):
     @onColor1.setter
     def onColor1(self, color):
         self.on_color_1 = color
+        self._buildGradients()
 
     @pyqtProperty(QColor)
     def onColor2(self):
@@ -216,6 +226,7 @@ class QLedIndicator(QAbstractButton):
     @onColor2.setter
     def onColor2(self, color):
         self.on_color_2 = color
+        self._buildGradients()
 
     @pyqtProperty(QColor)
     def offColor1(self):
@@ -224,6 +235,7 @@ class QLedIndicator(QAbstractButton):
     @offColor1.setter
     def offColor1(self, color):
         self.off_color_1 = color
+        self._buildGradients()
 
     @pyqtProperty(QColor)
     def offColor2(self):
@@ -232,6 +244,7 @@ class QLedIndicator(QAbstractButton):
     @offColor2.setter
     def offColor2(self, color):
         self.off_color_2 = color
+        self._buildGradients()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,543 @@
+"""
+================
+Title: Magnet Control GUI
+Author: Siyuan Qiu
+Create Date: 2024/12/23
+Institution: Stanford University, Department of Physics
+=================
+"""
+from PyQt5.QtWidgets import (QApplication, QFrame, QLabel, QComboBox, QPushButton, QCheckBox, QSpinBox,
+                             QDoubleSpinBox, QProgressBar, QVBoxLayout, QHBoxLayout, QGridLayout,
+                             QWidget)
+from PyQt5.QtGui import QFont, QColor, QPainter, QPen, QBrush, QRadialGradient, QPixmap
+from PyQt5.QtCore import (Qt, QPointF, QObject, QThread, QThreadPool, QTimer, pyqtSignal, pyqtSlot,
+                          pyqtProperty)
+import sys
+from ._visa import ResourceScanner, get_rm
+
+class MagnetControl(QFrame):
+    # (attribute, title, initial text, row, column) of the read-only displays
+    DISPLAY_TILES = [
+        ("status_display_lb", "Sweep Status", "sweep paused", 0, 0),
+        ("heater_display_lb", "P.S. Heater", "OFF", 0, 1),
+        ("upper_limit_display_lb", "Upper Sweep Limit", "", 0, 2),
+        ("output_current_display_lb", "Output Current (A)", "", 1, 0),
+        ("output_voltage_display_lb", "Output Voltage (V)", "", 1, 1),
+        ("lower_limit_display_lb", "Lower Sweep Limit", "", 1, 2),
+        ("magnet_current_display_lb", "Magnet Current (A)", "", 2, 0),
+        ("magnet_voltage_display_lb", "Magnet Voltage (V)", "", 2, 1),
+        ("voltage_limit_display_lb", "Voltage Limit", "", 2, 2),
+    ]
+
+    def __init__(self):
+        super().__init__()
+        self.setGeometry(500, 500, 800, 600)
+        self.res = None
+        self._poll_thread = None
+        self._poller = None
+        self.initUI()
+        self.show()
+
+    def initUI(self):
+        # build everything before the first layout/paint pass
+        self.setUpdatesEnabled(False)
+
+        # create main grid to organize layout
+        main_grid = QVBoxLayout()
+        main_grid.setSpacing(10)
+        self.setLayout(main_grid)
+        self.setWindowTitle("Magnet Control")
+
+        connect_hb = QHBoxLayout()
+
+        connect_vb = QVBoxLayout()
+        self.connect_btn = QPushButton("Connect")
+        self.connect_btn.clicked.connect(self.connect_to_magnet)
+        self.connect_ind = QLedIndicator("orange")
+        connect_vb.addWidget(self.connect_btn)
+        connect_vb.addWidget(self.connect_ind)
+        connect_hb.addLayout(connect_vb)
+
+        visa_vb = QVBoxLayout()
+        visa_lb = QLabel("VISA")
+        self.visa_cb = QComboBox()
+        visa_vb.addWidget(visa_lb)
+        visa_vb.addWidget(self.visa_cb)
+        connect_hb.addLayout(visa_vb)
+
+        model_vb = QVBoxLayout()
+        model_lb = QLabel("Model")
+        self.model_cb = QComboBox()
+        self.model_cb.addItems(["Cryo. Mag. CS-4", "Cryo. Mag. 4G"])
+        model_vb.addWidget(model_lb)
+        model_vb.addWidget(self.model_cb)
+        connect_hb.addLayout(model_vb)
+
+        interval_vb = QVBoxLayout()
+        interval_lb = QLabel("Update Interval (ms)")
+        self.interval_sb = QSpinBox()
+        # the poller re-arms itself with this delay, so 0 would query back to back
+        self.interval_sb.setMinimum(50)
+        self.interval_sb.setMaximum(1000)
+        self.interval_sb.setValue(500)
+        interval_vb.addWidget(interval_lb)
+        interval_vb.addWidget(self.interval_sb)
+        connect_hb.addLayout(interval_vb)
+        main_grid.addLayout(connect_hb)
+
+        main_display_grid = QGridLayout()
+        # one rule for every readout instead of a stylesheet per label
+        self.setStyleSheet("QLabel[role='display'] { border: 1px solid black; }")
+        self._displays = {}
+        # title on grid row 2 * row, readout right below it, all in the one grid
+        for attr, text, value, row, col in self.DISPLAY_TILES:
+            title_lb, display_lb = self._make_display_tile(text, value)
+            self._displays[attr] = display_lb
+            setattr(self, attr, display_lb)
+            main_display_grid.addWidget(title_lb, 2 * row, col, 1, 1, Qt.AlignCenter)
+            main_display_grid.addWidget(display_lb, 2 * row + 1, col, 1, 1, Qt.AlignCenter)
+        main_grid.addLayout(main_display_grid)
+
+        control_hb = QHBoxLayout()
+
+        control_vb = QVBoxLayout()
+        self.control_btn = QPushButton("Control On")
+        self.control_ind = QLedIndicator("orange")
+        control_vb.addWidget(self.control_btn)
+        control_vb.addWidget(self.control_ind)
+        control_hb.addLayout(control_vb)
+
+        self.mode_cb = QComboBox()
+        self.mode_cb.addItems(["Persistent", "Driving"])
+        control_hb.addWidget(self.mode_cb)
+
+        self.PSHtr_cb = QComboBox()
+        self.PSHtr_cb.addItems(["PSHt", "OFF"])
+        control_hb.addWidget(self.PSHtr_cb)
+
+        self.PSHtr_off_cb = QCheckBox("Turn off PSHtr after zeroing")
+        control_hb.addWidget(self.PSHtr_off_cb)
+        main_grid.addLayout(connect_hb)
+
+        control_ramp_hb = QHBoxLayout()
+
+        automatic_grid = QGridLayout()
+        automatic_lb = QLabel("Automatic")
+        automatic_grid.addWidget(automatic_lb, 0, 0, 1, 2, Qt.AlignCenter)
+        self.setpoint_sb = QSpinBox()
+        automatic_grid.addWidget(self.setpoint_sb, 1, 0, 1, 1, Qt.AlignCenter)
+        self.auto_ramp_btn = QPushButton("Ramp")
+        automatic_grid.addWidget(self.auto_ramp_btn, 1, 1, 1, 1, Qt.AlignCenter)
+        self.auto_zero_btn = QPushButton("Zero")
+        automatic_grid.addWidget(self.auto_zero_btn, 2, 0, 1, 1, Qt.AlignCenter)
+        self.auto_abort_btn = QPushButton("Abort")
+        automatic_grid.addWidget(self.auto_abort_btn, 2, 1, 1, 1, Qt.AlignCenter)
+        control_ramp_hb.addLayout(automatic_grid)
+
+        Separador1 = QFrame()
+        Separador1.setFrameShape(QFrame.VLine)
+        Separador1.setLineWidth(1)
+        control_ramp_hb.addWidget(Separador1)
+
+        manual_grid = QGridLayout()
+        manual_lb = QLabel("Manual")
+        manual_grid.addWidget(manual_lb, 0, 0, 1, 3, Qt.AlignCenter)
+        self.manual_up_btn = QPushButton()
+        manual_grid.addWidget(self.manual_up_btn, 1, 0, 1, 1, Qt.AlignCenter)
+        self.manual_zero_btn = QPushButton()
+        manual_grid.addWidget(self.manual_zero_btn, 1, 1, 1, 1, Qt.AlignCenter)
+        self.manual_limits_btn = QPushButton()
+        manual_grid.addWidget(self.manual_limits_btn, 1, 2, 1, 1, Qt.AlignCenter)
+        self.manual_down_btn = QPushButton()
+        manual_grid.addWidget(self.manual_down_btn, 2, 0, 1, 1, Qt.AlignCenter)
+        self.manual_pause_btn = QPushButton()
+        manual_grid.addWidget(self.manual_pause_btn, 2, 1, 1, 1, Qt.AlignCenter)
+        self.fast_sweep_cb = QCheckBox("Fast Sweep")
+        manual_grid.addWidget(self.fast_sweep_cb, 2, 2, 1, 1, Qt.AlignCenter)
+        control_ramp_hb.addLayout(manual_grid)
+        main_grid.addLayout(control_hb)
+
+        progress_hb = QHBoxLayout()
+
+        self.status_cb = QComboBox()
+        self.status_cb.addItems(["Not Connected", "Idle", "Sweeping", "Persistent", "Driving", "Wait"])
+        progress_hb.addWidget(self.status_cb)
+
+        progress_lb = QLabel("Progress")
+        progress_hb.addWidget(progress_lb)
+
+        self.progress_pbar = QProgressBar()
+        progress_hb.addWidget(self.progress_pbar)
+        main_grid.addLayout(progress_hb)
+
+        field_hb = QHBoxLayout()
+
+        # coalesce bursts of spinbox edits into one field update per frame
+        self._mul_timer = QTimer(self)
+        self._mul_timer.setSingleShot(True)
+        self._mul_timer.setInterval(16)
+        self._mul_timer.timeout.connect(self.multiplication)
+
+        current_vb = QVBoxLayout()
+        current_lb = QLabel("Current")
+        self.current_sb = QDoubleSpinBox()
+        self.current_sb.valueChanged.connect(lambda _: self._mul_timer.start())
+        current_vb.addWidget(current_lb)
+        current_vb.addWidget(self.current_sb)
+        field_hb.addLayout(current_vb)
+
+        multiply_lb = QLabel("X")
+        multiply_lb.setFixedWidth(30)
+        multiply_lb.setAlignment(Qt.AlignCenter)
+        field_hb.addWidget(multiply_lb)
+
+        ratio_vb = QVBoxLayout()
+        ratio_lb = QLabel("Ratio")
+        self.ratio_sb = QDoubleSpinBox()
+        self.ratio_sb.setDecimals(5)
+        self.ratio_sb.setValue(0.11971)
+        self.ratio_sb.valueChanged.connect(lambda _: self._mul_timer.start())
+        ratio_vb.addWidget(ratio_lb)
+        ratio_vb.addWidget(self.ratio_sb)
+        field_hb.addLayout(ratio_vb)
+
+        equal_lb = QLabel("=")
+        equal_lb.setFixedWidth(30)
+        equal_lb.setAlignment(Qt.AlignCenter)
+        field_hb.addWidget(equal_lb)
+
+        field_vb = QVBoxLayout()
+        field_lb = QLabel("Field")
+        self.field_sb = QDoubleSpinBox()
+        self.field_sb.setEnabled(False)
+        field_vb.addWidget(field_lb)
+        field_vb.addWidget(self.field_sb)
+        field_hb.addLayout(field_vb)
+
+        buffer_vb = QVBoxLayout()
+        buffer_lb = QLabel("Stable Buffer Size")
+        self.buffer_sb = QSpinBox()
+        self.buffer_sb.setValue(10)
+        buffer_vb.addWidget(buffer_lb)
+        buffer_vb.addWidget(self.buffer_sb)
+        field_hb.addLayout(buffer_vb)
+        main_grid.addLayout(field_hb)
+
+        # list VISA resources once the window is up instead of blocking construction
+        QTimer.singleShot(0, self._populate_visa)
+        self.setUpdatesEnabled(True)
+
+    def _populate_visa(self):
+        # the shared resource manager is created and enumerated off the GUI thread
+        self._resource_scanner = ResourceScanner()
+        self._resource_scanner.signals.finished.connect(self.visa_cb.addItems)
+        QThreadPool.globalInstance().start(self._resource_scanner)
+
+    def connect_to_magnet(self):
+        """Open the power supply selected in visa_cb"""
+        if self.res is not None:
+            print("✅ Already connected to magnet power supply.")
+            return
+
+        try:
+            self.res = get_rm().open_resource(self.visa_cb.currentText())
+            # read whole responses in one viRead instead of 20 kB chunks
+            self.res.chunk_size = 1024 * 1024
+            self.res.timeout = 2000
+            self.connect_btn.setText("Connected")
+            self.connect_ind.setState(True)
+            self.connect_ind.changeColor("green")
+            print("✅ Connected to magnet power supply.")
+            self._start_polling()
+        except Exception as e:
+            print("❌ Failed to connect to magnet power supply:", e)
+            self.res = None
+            self.connect_btn.setText("Failed")
+            self.connect_ind.setState(True)
+            self.connect_ind.changeColor("red")
+
+    def _start_polling(self):
+        # the poller owns the resource from here on, so VISA I/O never blocks the GUI thread
+        self._poll_thread = QThread(self)
+        self._poller = MagnetPoller(self.res, self.interval_sb.value())
+        self._poller.moveToThread(self._poll_thread)
+        self._poll_thread.started.connect(self._poller.poll)
+        self._poller.sample.connect(self.apply_poll)
+        self.interval_sb.valueChanged.connect(self._poller.setInterval)
+        QApplication.instance().aboutToQuit.connect(self._stop_polling)
+        self._poll_thread.start()
+
+    def _stop_polling(self):
+        if self._poll_thread is None:
+            return
+        self._poller.stop()
+        self._poll_thread.quit()
+        self._poll_thread.wait()
+        self._poll_thread = None
+
+    def shutdown(self):
+        '''stop the poll thread and release the supply before this window is thrown away'''
+        self._stop_polling()
+        if self.res is not None:
+            self.res.close()
+            self.res = None
+
+    @pyqtSlot(dict)
+    def apply_poll(self, sample):
+        '''write a {readout attribute: text} batch with one repaint for the whole frame'''
+        self.setUpdatesEnabled(False)
+        try:
+            for attr, value in sample.items():
+                display_lb = self._displays[attr]
+                if display_lb.text() != value:
+                    display_lb.setText(value)
+        finally:
+            # re-enabling schedules a single update of the frame
+            self.setUpdatesEnabled(True)
+
+    def _make_display_tile(self, text, value):
+        title_lb = QLabel(text)
+        title_lb.setFixedWidth(200)
+        display_lb = QLabel(value)
+        display_lb.setProperty('role', 'display')
+        display_lb.setFixedWidth(200)
+        return title_lb, display_lb
+
+    def multiplication(self):
+        # field_sb is display-only, nothing listens to its signals
+        self.field_sb.blockSignals(True)
+        self.field_sb.setValue(self.current_sb.value() * self.ratio_sb.value())
+        self.field_sb.blockSignals(False)
+
+
+class MagnetPoller(QObject):
+    '''read the power supply on a worker thread and emit {readout attribute: reply} every interval'''
+    # (readout attribute, query) read from the supply on every update tick
+    POLL_QUERIES = [
+        ("output_current_display_lb", "IOUT?"),
+        ("output_voltage_display_lb", "VOUT?"),
+        ("magnet_current_display_lb", "IMAG?"),
+        ("magnet_voltage_display_lb", "VMAG?"),
+        ("upper_limit_display_lb", "ULIM?"),
+        ("lower_limit_display_lb", "LLIM?"),
+        ("voltage_limit_display_lb", "VLIM?"),
+        ("heater_display_lb", "PSHTR?"),
+        ("status_display_lb", "SWEEP?"),
+    ]
+    _POLL_CMD = ";".join(cmd for _, cmd in POLL_QUERIES)
+
+    sample = pyqtSignal(dict)
+
+    def __init__(self, res, interval):
+        super().__init__()
+        self.res = res
+        self.interval = interval
+        self._compound_ok = True
+        self._running = True
+
+    @pyqtSlot(int)
+    def setInterval(self, interval):
+        self.interval = interval
+
+    def stop(self):
+        self._running = False
+
+    @pyqtSlot()
+    def poll(self):
+        if not self._running:
+            return
+
+        try:
+            values = self._query_all()
+        except Exception as e:
+            print(f"❌ Failed to poll magnet power supply: {e}")
+        else:
+            self.sample.emit({attr: value for (attr, _), value in zip(self.POLL_QUERIES, values)})
+
+        # re-armed here so a slow reply delays the next poll instead of queueing ticks
+        QTimer.singleShot(self.interval, self.poll)
+
+    def _query_all(self):
+        # one compound query per tick instead of a VISA round trip per readout
+        if self._compound_ok:
+            try:
+                reply = self.res.query(self._POLL_CMD)
+            except Exception:
+                # a timed-out reply can still arrive and would answer the next query, so drop it;
+                # the poll fails this tick and the compound form is tried again on the next
+                self.res.clear()
+                raise
+            parts = reply.split(";")
+            if len(parts) == len(self.POLL_QUERIES):
+                return [part.strip() for part in parts]
+            # the supply answered, but not with one field per query: it doesn't take the compound form
+            self._compound_ok = False
+            print("⚠️ Polling the magnet power supply one query at a time.")
+        return [self.res.query(cmd).strip() for _, cmd in self.POLL_QUERIES]
+
+
+# from https://github.com/nlamprian/pyqt5-led-indicator-widget/blob/master/LedIndicatorWidget.py
+class QLedIndicator(QWidget):
+    scaledSize = 1000.0
+
+    # (on_color_1, on_color_2, off_color_1, off_color_2), shared by every indicator
+    _PALETTES = {
+        'red': (QColor(255, 0, 0), QColor(192, 0, 0), QColor(28, 0, 0), QColor(128, 0, 0)),
+        'orange': (QColor(255, 175, 0), QColor(170, 115, 0), QColor(90, 60, 0), QColor(150, 100, 0)),
+        'green': (QColor(0, 255, 0), QColor(0, 192, 0), QColor(0, 28, 0), QColor(0, 128, 0)),
+    }
+    _pen = QPen(Qt.black, 1)
+
+    def __init__(self, color='green', parent=None):  # added a color option to use red or orange
+        QWidget.__init__(self, parent)
+
+        self.setMinimumSize(24, 24)
+
+        # display only: a plain widget with an on/off flag, no button input handling
+        self._on = False
+
+        # default to green if user does not give valid option
+        self.on_color_1, self.on_color_2, self.off_color_1, self.off_color_2 = \
+            self._PALETTES.get(color.lower(), self._PALETTES['green'])
+
+        # rendered LEDs keyed by (size, checked), only rebuilt on resize or color change;
+        # the bezel rings do not depend on color or state and are only redrawn on resize
+        self._cache = {}
+        self._ring = None
+        self._buildGradients()
+
+    def setState(self, on):
+        '''turn the LED on or off'''
+        if on != self._on:
+            self._on = on
+            self.update()
+
+    def _buildGradients(self):
+        self.on_gradient = QRadialGradient(QPointF(-500, -500), 1500, QPointF(-500, -500))
+        self.on_gradient.setColorAt(0, self.on_color_1)
+        self.on_gradient.setColorAt(1, self.on_color_2)
+        self.off_gradient = QRadialGradient(QPointF(500, 500), 1500, QPointF(500, 500))
+        self.off_gradient.setColorAt(0, self.off_color_1)
+        self.off_gradient.setColorAt(1, self.off_color_2)
+        self._cache.clear()
+
+    def changeColor(self, color):
+        '''change color by inputting a string only for red, orange, and green'''
+        if color.lower() not in self._PALETTES:
+            return
+        self.on_color_1, self.on_color_2, self.off_color_1, self.off_color_2 = self._PALETTES[color.lower()]
+
+        self._buildGradients()
+        self.update()
+
+    def resizeEvent(self, QResizeEvent):
+        self._cache.clear()
+        self._ring = None
+        self.update()
+
+    def _newPainter(self, pixmap, realSize):
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.translate(realSize / 2, realSize / 2)
+        painter.scale(realSize / self.scaledSize, realSize / self.scaledSize)
+        return painter
+
+    def _renderRing(self, realSize):
+        '''draw the two state-independent bezel rings into a transparent pixmap'''
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(int(realSize * ratio), int(realSize * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+
+        painter = self._newPainter(pixmap, realSize)
+        pen = self._pen
+
+        gradient = QRadialGradient(QPointF(-500, -500), 1500, QPointF(-500, -500))
+        gradient.setColorAt(0, QColor(224, 224, 224))
+        gradient.setColorAt(1, QColor(28, 28, 28))
+        painter.setPen(pen)
+        painter.setBrush(QBrush(gradient))
+        painter.drawEllipse(QPointF(0, 0), 500, 500)
+
+        gradient = QRadialGradient(QPointF(500, 500), 1500, QPointF(500, 500))
+        gradient.setColorAt(0, QColor(224, 224, 224))
+        gradient.setColorAt(1, QColor(28, 28, 28))
+        painter.setPen(pen)
+        painter.setBrush(QBrush(gradient))
+        painter.drawEllipse(QPointF(0, 0), 450, 450)
+        painter.end()
+        return pixmap
+
+    def _render(self, realSize, checked):
+        '''draw the colored disc on top of a copy of the cached rings'''
+        if self._ring is None:
+            self._ring = self._renderRing(realSize)
+        pixmap = self._ring.copy()
+
+        painter = self._newPainter(pixmap, realSize)
+        pen = self._pen
+        painter.setPen(pen)
+        painter.setBrush(self.on_gradient if checked else self.off_gradient)
+        painter.drawEllipse(QPointF(0, 0), 400, 400)
+        painter.end()
+        return pixmap
+
+    def paintEvent(self, QPaintEvent):
+        realSize = min(self.width(), self.height())
+        if realSize <= 0:
+            return
+
+        key = (realSize, self._on)
+        pixmap = self._cache.get(key)
+        if pixmap is None:
+            pixmap = self._render(realSize, self._on)
+            self._cache[key] = pixmap
+
+        painter = QPainter(self)
+        painter.drawPixmap((self.width() - realSize) // 2, (self.height() - realSize) // 2, pixmap)
+
+    @pyqtProperty(QColor)
+    def onColor1(self):
+        return self.on_color_1
+
+    @onColor1.setter
+    def onColor1(self, color):
+        self.on_color_1 = color
+        self._buildGradients()
+
+    @pyqtProperty(QColor)
+    def onColor2(self):
+        return self.on_color_2
+
+    @onColor2.setter
+    def onColor2(self, color):
+        self.on_color_2 = color
+        self._buildGradients()
+
+    @pyqtProperty(QColor)
+    def offColor1(self):
+        return self.off_color_1
+
+    @offColor1.setter
+    def offColor1(self, color):
+        self.off_color_1 = color
+        self._buildGradients()
+
+    @pyqtProperty(QColor)
+    def offColor2(self):
+        return self.off_color_2
+
+    @offColor2.setter
+    def offColor2(self, color):
+        self.off_color_2 = color
+        self._buildGradients()
+
+if __name__ == '__main__':
+    app = QApplication(sys.argv)
+    # Calibri is usually missing on Linux; name the metric-compatible fallbacks up front
+    QFont.insertSubstitutions("Calibri", ["Carlito", "DejaVu Sans"])
+    font = QFont("Calibri")
+    font.setPointSize(14)
+    app.setFont(font)
+    window = MagnetControl()
+    sys.exit(app.exec_())
\ No newline at end of file
@@ -0,0 +1,743 @@
+"""
+================
+Title: MIM Control GUI
+Author: Siyuan Qiu
+Create Date: 2024/12/17
+Institution: Stanford University, Department of Physics
+=================
+"""
+from PyQt5.QtWidgets import (QAbstractButton, QComboBox, QDoubleSpinBox, QFrame, QHBoxLayout, QLabel,
+                             QPushButton, QSlider, QSpinBox, QTabWidget, QVBoxLayout, QWidget)
+from PyQt5.QtGui import QBrush, QColor, QPainter, QPainterPath, QPen, QPixmap, QRadialGradient, QTransform
+from PyQt5.QtCore import QPoint, QPointF, QStringListModel, QThreadPool, QTimer, Qt, pyqtProperty
+import pyqtgraph as pg
+import numpy as np
+import importlib.util
+import time
+from ._visa import ResourceScanner, VisaWorker, get_rm
+
+# draw the streaming plots through OpenGL when PyOpenGL is installed (optional dependency)
+_HAVE_OPENGL = importlib.util.find_spec("OpenGL") is not None
+
+class MIMControl(QFrame):
+    # number of samples shown in the power monitor trace
+    POWER_MONITOR_POINTS = 2000
+
+    def __init__(self):
+        super().__init__()
+        self.setGeometry(400, 400, 1300, 750)
+        # open VISA sessions by resource name, only touched from VisaWorker threads
+        self._sessions = {}
+        # set once the lock-in has been opened with its Connect button; Aux writes go nowhere before that
+        self._lockin_address = None
+        # lock-in settings changed within 20 ms of each other go out as one compound write
+        self._pending_writes = {}
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(20)
+        self._flush_timer.timeout.connect(self._flush_writes)
+        self.initUI()
+
+    def initUI(self):
+        # build everything before the first layout/paint pass
+        self.setUpdatesEnabled(False)
+
+        # create main grid to organize layout
+        main_grid = QVBoxLayout()
+        main_grid.setSpacing(10)
+        self.setLayout(main_grid)
+        self.setWindowTitle("MIM Control")
+
+        # create top hb
+        main_hb = QHBoxLayout()
+
+        # both instrument selectors list the same VISA resources, so they share one model
+        self._resource_model = QStringListModel()
+
+        lockin_vb = QVBoxLayout()
+        lockin_lb = QLabel("Lockin")
+        self.lockin_cb = QComboBox()
+        self.lockin_cb.setModel(self._resource_model)
+        lockin_vb.addWidget(lockin_lb)
+        lockin_vb.addWidget(self.lockin_cb)
+        lockin_connect_hb = QHBoxLayout()
+        self.lockin_connect_btn = QPushButton("Connect")
+        self.lockin_connect_btn.clicked.connect(self.connect_to_lockin)
+        self.lockin_ind = QLedIndicator("orange")
+        lockin_connect_hb.addWidget(self.lockin_connect_btn)
+        lockin_connect_hb.addWidget(self.lockin_ind)
+        lockin_vb.addLayout(lockin_connect_hb)
+        main_hb.addLayout(lockin_vb)
+
+        agilent_vb = QVBoxLayout()
+        agilent_lb = QLabel("Agilent Source")
+        self.agilent_cb = QComboBox()
+        self.agilent_cb.setModel(self._resource_model)
+        agilent_vb.addWidget(agilent_lb)
+        agilent_vb.addWidget(self.agilent_cb)
+        main_hb.addLayout(agilent_vb)
+
+        Separador1 = QFrame()
+        Separador1.setFrameShape(QFrame.VLine)
+        Separador1.setLineWidth(1)
+        main_hb.addWidget(Separador1)
+
+        power_offset_vb = QVBoxLayout()
+        power_offset_lb = QLabel("Excitation Power Offset (dBm) \nWhen Atten=0dB")
+        self.power_offset_sb = self._spin_box(-50, 0, -35)
+        power_offset_vb.addWidget(power_offset_lb)
+        power_offset_vb.addWidget(self.power_offset_sb)
+        main_hb.addLayout(power_offset_vb)
+
+        excitation_atten_vb, self.excitation_atten_sld, self.excitation_atten_sb = \
+            self._make_ranged_slider("Excitation Atten", 0, 31.5)
+        main_hb.addLayout(excitation_atten_vb)
+
+        RF_power_vb = QVBoxLayout()
+        RF_power_lb = QLabel("RF Source Power (dBm)")
+        self.RF_power_sb = QDoubleSpinBox()
+        self.RF_power_btn = QPushButton("Set")
+        RF_power_vb.addWidget(RF_power_lb)
+        RF_power_vb.addWidget(self.RF_power_sb)
+        RF_power_vb.addWidget(self.RF_power_btn)
+        main_hb.addLayout(RF_power_vb)
+
+        main_grid.addLayout(main_hb)
+
+        # create tab screen
+        self.tabs = QTabWidget()
+        self.tabs.setMaximumHeight(500)
+        main_grid.addWidget(self.tabs)
+
+        # initalize all tabs
+        self.initControlTab()
+        self.initTuningTab()
+
+        # list VISA resources once the window is up instead of blocking construction
+        QTimer.singleShot(0, self._populate_visa)
+        self.setUpdatesEnabled(True)
+
+    def _populate_visa(self):
+        # the shared resource manager is created and enumerated off the GUI thread
+        self._resource_scanner = ResourceScanner()
+        self._resource_scanner.signals.finished.connect(self._set_resources)
+        QThreadPool.globalInstance().start(self._resource_scanner)
+
+    def _set_resources(self, resources):
+        self._resource_model.setStringList(resources)
+
+    def connect_to_lockin(self):
+        """Open the lock-in selected in lockin_cb"""
+        if self._lockin_address is not None:
+            print("✅ Already connected to lock-in.")
+            return
+        worker = VisaWorker(self._open_session, self.lockin_cb.currentText())
+        worker.signals.result.connect(self._lockin_connected)
+        worker.signals.error.connect(self._lockin_failed)
+        QThreadPool.globalInstance().start(worker)
+
+    def _lockin_connected(self, address):
+        self._lockin_address = address
+        self.lockin_connect_btn.setText("Connected")
+        self.lockin_ind.setChecked(True)
+        self.lockin_ind.changeColor("green")
+        print("✅ Connected to lock-in.")
+
+    def _lockin_failed(self, error):
+        print("❌ Failed to connect to lock-in:", error)
+        self.lockin_connect_btn.setText("Failed")
+        self.lockin_ind.setChecked(True)
+        self.lockin_ind.changeColor("red")
+
+    def _run_visa(self, fn, *args):
+        # VISA calls can block for seconds, so they run on the thread pool, never on the GUI thread
+        worker = VisaWorker(fn, *args)
+        worker.signals.result.connect(lambda message: print(f"✅ {message}"))
+        worker.signals.error.connect(lambda e: print(f"❌ VISA command failed: {e}"))
+        QThreadPool.globalInstance().start(worker)
+
+    def _open_session(self, address):
+        # runs on a worker thread
+        if address not in self._sessions:
+            self._sessions[address] = get_rm().open_resource(address)
+        return address
+
+    def _write_visa(self, address, cmd, message):
+        # runs on a worker thread; the widget values were read on the GUI thread
+        self._sessions[self._open_session(address)].write(cmd)
+        return message
+
+    def _queue_write(self, cmd, value):
+        if self._lockin_address is None:
+            return
+        self._pending_writes[cmd] = value
+        self._flush_timer.start()
+
+    def _flush_writes(self):
+        if not self._pending_writes:
+            return
+        cmd = ";".join(f"{key} {value:.4f}" for key, value in self._pending_writes.items())
+        self._pending_writes.clear()
+        self._run_visa(self._write_visa, self._lockin_address, cmd, f"Sent {cmd} to lock-in")
+
+    def shutdown(self):
+        '''send any pending lock-in write and close the VISA sessions before this window is thrown away'''
+        self._flush_timer.stop()
+        self._flush_writes()
+        if self._sessions:
+            self._run_visa(self._close_sessions)
+
+    def _close_sessions(self):
+        # runs on a worker thread like every other use of the sessions
+        for session in self._sessions.values():
+            session.close()
+        self._sessions.clear()
+        return "Closed MIM VISA sessions"
+
+    def initControlTab(self):
+        # create tab
+        control_tab = QWidget()
+
+        # create main hbox and main vbox to organize layout
+        main_hbox = QHBoxLayout()
+        main_hbox.setSpacing(10)
+        control_tab.setLayout(main_hbox)
+
+        main_vbox1 = QVBoxLayout()
+
+        excitation_vbox = QVBoxLayout()
+
+        excitation_lb = QLabel("Excitation")
+        excitation_vbox.addWidget(excitation_lb)
+
+        freq_lb = QLabel("Frequency (MHz)")
+        self.freq_sb = self._spin_box(0, 10000, 1000)
+        excitation_vbox.addWidget(freq_lb)
+        excitation_vbox.addWidget(self.freq_sb)
+
+        power_lb = QLabel("Power (dBm)")
+        self.power_sb = self._spin_box(-100, 0, -40)
+        self.power_set_btn = QPushButton("Set")
+        excitation_vbox.addWidget(power_lb)
+        excitation_vbox.addWidget(self.power_sb)
+        excitation_vbox.addWidget(self.power_set_btn)
+
+        reference_vbox = QVBoxLayout()
+
+        reference_lb = QLabel("Reference")
+        reference_vbox.addWidget(reference_lb)
+
+        ref_phase_vb, self.ref_phase_sld, self.ref_phase_sb = \
+            self._make_ranged_slider("Ref Phase (Aux2)", 0, 10, cmd="AUXV 2,")
+        reference_vbox.addLayout(ref_phase_vb)
+
+        main_vbox1.addLayout(excitation_vbox)
+        main_vbox1.addLayout(reference_vbox)
+
+        main_vbox2 = QVBoxLayout()
+
+        cancellation_vb = QVBoxLayout()
+
+        cancellation_lb = QLabel("Cancellation")
+        cancellation_vb.addWidget(cancellation_lb)
+
+        cancel_phase_vb, self.cancel_phase_sld, self.cancel_phase_sb = \
+            self._make_ranged_slider("Cancel Phase (Aux1)", -1, 10.5, cmd="AUXV 1,")
+        cancellation_vb.addLayout(cancel_phase_vb)
+
+        cancel_atten_vb, self.cancel_atten_sld, self.cancel_atten_sb = \
+            self._make_ranged_slider("Cancel Atten Digital (dB)", 0, 31.5)
+        cancellation_vb.addLayout(cancel_atten_vb)
+
+        cancel_atten_analog_vb, self.cancel_atten_analog_sld, self.cancel_atten_analog_sb = \
+            self._make_ranged_slider("Cancel Atten Analog (Aux3)", -3, 10, cmd="AUXV 3,")
+        cancellation_vb.addLayout(cancel_atten_analog_vb)
+
+        main_vbox2.addLayout(cancellation_vb)
+
+        main_vbox3 = QVBoxLayout()
+        power_monitor_hb = QHBoxLayout()
+        self.start_monitor_btn = QPushButton("Start monitor")
+        self.monitor_ind = QLedIndicator('orange')
+        # at least 1 ms: the paint timer runs at this interval and 0 would busy-loop it
+        self.refresh_rate = self._spin_box(1, 99.99, 10.0)
+        refresh_rate_unit_lb = QLabel("ms")
+        power_monitor_hb.addWidget(self.start_monitor_btn)
+        power_monitor_hb.addWidget(self.monitor_ind)
+        power_monitor_hb.addWidget(self.refresh_rate)
+        power_monitor_hb.addWidget(refresh_rate_unit_lb)
+        main_vbox3.addLayout(power_monitor_hb)
+
+        self.power_monitor_plot = pg.PlotWidget()
+        self.power_monitor_plot.setBackground('w')
+        if _HAVE_OPENGL:
+            self.power_monitor_plot.useOpenGL(True)
+        self.power_monitor_plot.setDownsampling(auto=True, mode='peak')
+        self.power_monitor_plot.setClipToView(True)
+        # static chrome: no auto-range button or context menu to rebuild, and a fixed light grid
+        monitor_item = self.power_monitor_plot.getPlotItem()
+        monitor_item.hideButtons()
+        monitor_item.setMenuEnabled(False)
+        monitor_item.showGrid(x=True, y=True, alpha=0.2)
+        main_vbox3.addWidget(self.power_monitor_plot)
+
+        # fixed-size ring buffer; every sample is stored twice so the latest
+        # POWER_MONITOR_POINTS values are always one contiguous slice (no roll/concatenate)
+        n = self.POWER_MONITOR_POINTS
+        self._pm_x = np.arange(n, dtype=np.float64)
+        self._pm_y = np.zeros(2 * n, dtype=np.float64)
+        self._pm_idx = 0
+        self.power_monitor_curve = self.power_monitor_plot.plot(self._pm_x, self._pm_y[:n], pen=pg.mkPen('b', width=1))
+
+        # samples only go into the buffer; the trace is redrawn from this timer at the
+        # refresh rate, skipping ticks while a redraw takes longer than the interval
+        self._pm_drawn = 0
+        self._paint_tick = 0
+        self._disp_skip = 1
+        self._paint_timer = QTimer(self)
+        self._paint_timer.setTimerType(Qt.PreciseTimer)
+        self._paint_timer.setInterval(int(self.refresh_rate.value()))
+        self._paint_timer.timeout.connect(self._refresh_power_plot)
+        self.refresh_rate.valueChanged.connect(lambda value: self._paint_timer.setInterval(int(value)))
+
+        main_hbox.addStretch()
+
+        main_hbox.addLayout(main_vbox1)
+        main_hbox.addLayout(main_vbox2)
+        main_hbox.addLayout(main_vbox3)
+
+        self.tabs.addTab(control_tab, 'MIM Control')
+
+    def _make_ranged_slider(self, label, lo, hi, val=0, cmd=None):
+        '''title, slider and a min/spinbox/max row, with slider and spinbox kept in sync;
+        if cmd is given, changes are queued as "<cmd> <value>" writes to the lock-in'''
+        vb = QVBoxLayout()
+        title_lb = QLabel(label)
+        sld = QDoubleSlider()
+        sld.setOrientation(Qt.Horizontal)
+        sld.blockSignals(True)
+        sld.setMinimum(lo)
+        sld.setMaximum(hi)
+        sld.setValue(val)
+        sld.blockSignals(False)
+        sld.setTickPosition(QSlider.TicksBelow)
+        sld.setTickInterval(10000)
+        sld.setSingleStep(1)
+        sb = self._spin_box(lo, hi, val)
+        hb = QHBoxLayout()
+        min_lb = QLabel(f"{lo:g}")
+        min_lb.setAlignment(Qt.AlignLeft)
+        max_lb = QLabel(f"{hi:g}")
+        max_lb.setAlignment(Qt.AlignRight)
+        hb.addWidget(min_lb)
+        hb.addWidget(sb)
+        hb.addWidget(max_lb)
+        vb.addWidget(title_lb)
+        vb.addWidget(sld)
+        vb.addLayout(hb)
+
+        sld.valueChanged.connect(lambda _: self._sync_value(sb, sld.value()))
+        sb.valueChanged.connect(lambda value: self._sync_value(sld, value))
+        if cmd is not None:
+            # sb always ends up holding the value, whichever widget the user moved
+            sld.valueChanged.connect(lambda _: self._queue_write(cmd, sb.value()))
+            sb.valueChanged.connect(lambda value: self._queue_write(cmd, value))
+        return vb, sld, sb
+
+    @staticmethod
+    def _spin_box(lo, hi, val=0):
+        '''QDoubleSpinBox with its range and start value set in one pass, without emitting valueChanged'''
+        sb = QDoubleSpinBox()
+        sb.blockSignals(True)
+        sb.setRange(lo, hi)
+        sb.setValue(val)
+        sb.blockSignals(False)
+        return sb
+
+    @staticmethod
+    def _sync_value(widget, value):
+        # blocked so the two widgets do not bounce the value back and forth
+        widget.blockSignals(True)
+        widget.setValue(value)
+        widget.blockSignals(False)
+
+    def append_power(self, value):
+        '''add one power monitor sample; the trace is redrawn by the paint timer'''
+        n = self.POWER_MONITOR_POINTS
+        i = self._pm_idx % n
+        self._pm_y[i] = value
+        self._pm_y[i + n] = value
+        self._pm_idx += 1
+        if not self._paint_timer.isActive():
+            self._paint_timer.start()
+
+    def _refresh_power_plot(self):
+        # idle or hidden: the timer stops until append_power or showEvent starts it again
+        if self._pm_idx == self._pm_drawn or not self.isVisible():
+            self._paint_timer.stop()
+            return
+        self._paint_tick += 1
+        if self._paint_tick % self._disp_skip:
+            return
+
+        t0 = time.perf_counter()
+        n = self.POWER_MONITOR_POINTS
+        start = self._pm_idx % n
+        self.power_monitor_curve.setData(self._pm_x, self._pm_y[start:start + n])
+        self._pm_drawn = self._pm_idx
+
+        # draw every tick while a redraw fits in the interval, otherwise every k-th tick
+        elapsed_ms = (time.perf_counter() - t0) * 1000
+        self._disp_skip = int(elapsed_ms // max(self._paint_timer.interval(), 1)) + 1
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._pm_idx != self._pm_drawn and not self._paint_timer.isActive():
+            self._paint_timer.start()
+
+    def initTuningTab(self):
+        # create tab
+        tuning_tab = QWidget()
+
+        # create main hbox and main vbox to organize layout
+        main_hbox = QHBoxLayout()
+        main_hbox.setSpacing(10)
+        tuning_tab.setLayout(main_hbox)
+
+        main_vbox1 = QVBoxLayout()
+
+        param_vb = QVBoxLayout()
+        param_lb = QLabel("Sweep Param")
+        self.param_cb = QComboBox()
+        self.param_cb.addItems(["Frequency", "Ref Phase"])
+        param_vb.addWidget(param_lb)
+        param_vb.addWidget(self.param_cb)
+        main_vbox1.addLayout(param_vb)
+
+        start_hb = QHBoxLayout()
+        start_vb = QVBoxLayout()
+        start_lb = QLabel("Start")
+        self.start_sb = QSpinBox()
+        start_vb.addWidget(start_lb)
+        start_vb.addWidget(self.start_sb)
+        stop_vb = QVBoxLayout()
+        stop_lb = QLabel("Stop")
+        self.stop_sb = QSpinBox()
+        stop_vb.addWidget(stop_lb)
+        stop_vb.addWidget(self.stop_sb)
+        start_hb.addLayout(start_vb)
+        start_hb.addLayout(stop_vb)
+        main_vbox1.addLayout(start_hb)
+
+        step_hb = QHBoxLayout()
+        step_vb = QVBoxLayout()
+        step_lb = QLabel("Step")
+        self.step_sb = QSpinBox()
+        step_vb.addWidget(step_lb)
+        step_vb.addWidget(self.step_sb)
+        step_time_vb = QVBoxLayout()
+        step_time_lb = QLabel("Step Time (ms)")
+        self.step_time_sb = QSpinBox()
+        step_time_vb.addWidget(step_time_lb)
+        step_time_vb.addWidget(self.step_time_sb)
+        step_hb.addLayout(step_vb)
+        step_hb.addLayout(step_time_vb)
+        main_vbox1.addLayout(step_hb)
+
+        recording_vb = QVBoxLayout()
+        recording_lb = QLabel("Recording Param")
+        self.recording_cb = QComboBox()
+        self.recording_cb.addItems(["Power monitor", "Main Ch1", "Main Ch2", "Main Ch3", "Main Ch4"])
+        recording_vb.addWidget(recording_lb)
+        recording_vb.addWidget(self.recording_cb)
+        main_vbox1.addLayout(recording_vb)
+
+        button_hb = QHBoxLayout()
+        self.start_btn = QPushButton("Start")
+        self.stop_btn = QPushButton("Stop")
+        button_hb.addWidget(self.start_btn)
+        button_hb.addWidget(self.stop_btn)
+        main_vbox1.addLayout(button_hb)
+
+        main_vbox2 = QVBoxLayout()
+        self.freq_sweep_plot = pg.PlotWidget()
+        self.freq_sweep_plot.setBackground('w')
+        if _HAVE_OPENGL:
+            self.freq_sweep_plot.useOpenGL(True)
+        self.freq_sweep_plot.setDownsampling(auto=True, mode='peak')
+        self.freq_sweep_plot.setClipToView(True)
+        main_vbox2.addWidget(self.freq_sweep_plot)
+
+        # one persistent curve, redrawn at most once per step time instead of once per point
+        self.freq_sweep_curve = self.freq_sweep_plot.plot(pen=pg.mkPen('b', width=1))
+        self._sweep_x = np.empty(0)
+        self._sweep_y = np.empty(0)
+        self._sweep_n = 0
+        self._sweep_dirty = False
+        self._sweep_timer = QTimer(self)
+        self._sweep_timer.timeout.connect(self._flush_sweep)
+
+        main_hbox.addLayout(main_vbox1)
+        main_hbox.addLayout(main_vbox2)
+
+        self.tabs.addTab(tuning_tab, 'Tuning')
+
+    def begin_sweep(self, x):
+        '''clear the tuning plot and preallocate a sweep over the parameter values x'''
+        self._sweep_x = np.asarray(x, dtype=np.float64)
+        self._sweep_y = np.full(len(self._sweep_x), np.nan)
+        self._sweep_n = 0
+        self._sweep_dirty = False
+        self.freq_sweep_curve.setData([], [])
+        self._sweep_timer.start(max(self.step_time_sb.value(), 16))
+
+    def add_sweep_point(self, value):
+        '''record the reading for the next sweep point; the plot catches up on the next flush'''
+        self._sweep_y[self._sweep_n] = value
+        self._sweep_n += 1
+        self._sweep_dirty = True
+        if self._sweep_n == len(self._sweep_y):
+            self._sweep_timer.stop()
+            self._flush_sweep()
+
+    def _flush_sweep(self):
+        if not self._sweep_dirty:
+            return
+        self._sweep_dirty = False
+        n = self._sweep_n
+        self.freq_sweep_curve.setData(self._sweep_x[:n], self._sweep_y[:n])
+
+
+# from https://github.com/nlamprian/pyqt5-led-indicator-widget/blob/master/LedIndicatorWidget.py
+class QLedIndicator(QAbstractButton):
+    scaledSize = 1000.0
+
+    def __init__(self, color='green', parent=None):  # added a color option to use red or orange
+        QAbstractButton.__init__(self, parent)
+
+        self.setMinimumSize(24, 24)
+        self.setCheckable(True)
+
+        # prevent user from changing indicator color by clicking
+        self.setEnabled(False)
+
+        if color.lower() == 'red':
+            self.on_color_1 = QColor(255, 0, 0)
+            self.on_color_2 = QColor(192, 0, 0)
+            self.off_color_1 = QColor(28, 0, 0)
+            self.off_color_2 = QColor(128, 0, 0)
+        elif color.lower() == 'orange':
+            self.on_color_1 = QColor(255, 175, 0)
+            self.on_color_2 = QColor(170, 115, 0)
+            self.off_color_1 = QColor(90, 60, 0)
+            self.off_color_2 = QColor(150, 100, 0)
+        else:  # default to green if user does not give valid option
+            self.on_color_1 = QColor(0, 255, 0)
+            self.on_color_2 = QColor(0, 192, 0)
+            self.off_color_1 = QColor(0, 28, 0)
+            self.off_color_2 = QColor(0, 128, 0)
+        self._buildGradients()
+
+        # the two bezel rings never change with state or color, so they are
+        # drawn once per size into a pixmap and only the inner disc is painted live
+        self._bg_cache = None
+
+        # the three circles are in the fixed scaledSize coordinate system, so their paths never change
+        self._paths = []
+        for radius in (500, 450, 400):
+            path = QPainterPath()
+            path.addEllipse(QPointF(0, 0), radius, radius)
+            self._paths.append(path)
+        self._updateGeometry()
+
+    def changeColor(self, color):
+        '''change color by inputting a string only for red, orange, and green'''
+        if color.lower() == 'red':
+            self.on_color_1 = QColor(255, 0, 0)
+            self.on_color_2 = QColor(192, 0, 0)
+            self.off_color_1 = QColor(28, 0, 0)
+            self.off_color_2 = QColor(128, 0, 0)
+        elif color.lower() == 'orange':
+            self.on_color_1 = QColor(255, 175, 0)
+            self.on_color_2 = QColor(170, 115, 0)
+            self.off_color_1 = QColor(90, 60, 0)
+            self.off_color_2 = QColor(150, 100, 0)
+        elif color.lower() == 'green':
+            self.on_color_1 = QColor(0, 255, 0)
+            self.on_color_2 = QColor(0, 192, 0)
+            self.off_color_1 = QColor(0, 28, 0)
+            self.off_color_2 = QColor(0, 128, 0)
+
+        self._buildGradients()
+        self.update()
+
+    def _buildGradients(self):
+        '''build the on/off disc gradients once per color change instead of on every paint'''
+        self._on_gradient = QRadialGradient(QPointF(-500, -500), 1500, QPointF(-500, -500))
+        self._on_gradient.setColorAt(0, self.on_color_1)
+        self._on_gradient.setColorAt(1, self.on_color_2)
+        self._off_gradient = QRadialGradient(QPointF(500, 500), 1500, QPointF(500, 500))
+        self._off_gradient.setColorAt(0, self.off_color_1)
+        self._off_gradient.setColorAt(1, self.off_color_2)
+
+    def _updateGeometry(self):
+        '''work out everything paintEvent needs from the widget size, once per resize'''
+        self._real_size = min(self.width(), self.height())
+        self._scale_factor = self._real_size / self.scaledSize
+        self._center = QPointF(self.width() / 2, self.height() / 2)
+        self._bg_origin = QPoint((self.width() - self._real_size) // 2, (self.height() - self._real_size) // 2)
+        self._transform = QTransform(self._scale_factor, 0, 0, self._scale_factor,
+                                     self._center.x(), self._center.y())
+
+    def resizeEvent(self, QResizeEvent):
+        self._updateGeometry()
+        self._bg_cache = None
+        self.update()
+
+    def _renderBackground(self, realSize):
+        '''draw the two outer rings into a transparent pixmap of the given size'''
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(int(realSize * ratio), int(realSize * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+
+        painter = QPainter(pixmap)
+        pen = QPen(Qt.black)
+        pen.setWidth(1)
+
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.translate(realSize / 2, realSize / 2)
+        painter.scale(realSize / self.scaledSize, realSize / self.scaledSize)
+
+        gradient = QRadialGradient(QPointF(-500, -500), 1500, QPointF(-500, -500))
+        gradient.setColorAt(0, QColor(224, 224, 224))
+        gradient.setColorAt(1, QColor(28, 28, 28))
+        painter.setPen(pen)
+        painter.setBrush(QBrush(gradient))
+        painter.drawPath(self._paths[0])
+
+        gradient = QRadialGradient(QPointF(500, 500), 1500, QPointF(500, 500))
+        gradient.setColorAt(0, QColor(224, 224, 224))
+        gradient.setColorAt(1, QColor(28, 28, 28))
+        painter.setPen(pen)
+        painter.setBrush(QBrush(gradient))
+        painter.drawPath(self._paths[1])
+        painter.end()
+        return pixmap
+
+    def paintEvent(self, QPaintEvent):
+        if self._real_size <= 0:
+            return
+
+        if self._bg_cache is None:
+            self._bg_cache = self._renderBackground(self._real_size)
+
+        painter = QPainter(self)
+        painter.drawPixmap(self._bg_origin, self._bg_cache)
+
+        pen = QPen(Qt.black)
+        pen.setWidth(1)
+
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setTransform(self._transform)
+
+        painter.setPen(pen)
+        painter.setBrush(self._on_gradient if self.isChecked() else self._off_gradient)
+        painter.drawPath(self._paths[2])
+
+    @pyqtProperty(QColor)
+    def onColor1(self):
+        return self.on_color_1
+
+    @onColor1.setter
+    def onColor1(self, color):
+        self.on_color_1 = color
+        self._buildGradients()
+
+    @pyqtProperty(QColor)
+    def onColor2(self):
+        return self.on_color_2
+
+    @onColor2.setter
+    def onColor2(self, color):
+        self.on_color_2 = color
+        self._buildGradients()
+
+    @pyqtProperty(QColor)
+    def offColor1(self):
+        return self.off_color_1
+
+    @offColor1.setter
+    def offColor1(self, color):
+        self.off_color_1 = color
+        self._buildGradients()
+
+    @pyqtProperty(QColor)
+    def offColor2(self):
+        return self.off_color_2
+
+    @offColor2.setter
+    def offColor2(self, color):
+        self.off_color_2 = color
+        self._buildGradients()
+
+# from https://gist.github.com/dennis-tra/994a65d6165a328d4eabaadbaedac2cc
+class QDoubleSlider(QSlider):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.decimals = 5
+        self._max_int = 10 ** self.decimals
+
+        super().setMinimum(0)
+        super().setMaximum(self._max_int)
+
+        self._min_value = 0.0
+        self._max_value = 1.0
+        self._update_scale()
+
+    @property
+    def _value_range(self):
+        return self._max_value - self._min_value
+
+    def _update_scale(self):
+        # value() and setValue() run on every drag event, so keep the conversion to one multiply
+        self._scale = self._value_range / self._max_int
+        self._inv_scale = self._max_int / self._value_range if self._value_range else 0.0
+
+    def value(self):
+        return super().value() * self._scale + self._min_value
+
+    def setValue(self, value):
+        super().setValue(int((value - self._min_value) * self._inv_scale))
+
+    def setMinimum(self, value):
+        if value > self._max_value:
+            raise ValueError("Minimum limit cannot be higher than maximum")
+
+        self._min_value = value
+        self._update_scale()
+        self.setValue(self.value())
+
+    def setMaximum(self, value):
+        if value < self._min_value:
+            raise ValueError("Minimum limit cannot be higher than maximum")
+
+        self._max_value = value
+        self._update_scale()
+        self.setValue(self.value())
+
+    def minimum(self):
+        return self._min_value
+
+    def maximum(self):
+        return self._max_value
+
+# if __name__ == '__main__':
+#     app = QApplication(sys.argv)
+#     font = QFont("Calibri")
+#     font.setPointSize(14)  # Set font size (14pt in this example)
+#     app.setFont(font)
+#     window = MIMControl()
+#     window.show()
+#     sys.exit(app.exec_())
\ No newline at end of file
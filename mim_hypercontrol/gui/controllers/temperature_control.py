@@ -0,0 +1,777 @@
+"""
+================
+Title: Temperature Control GUI
+Author: Siyuan Qiu
+Create Date: 2024/12/19
+Institution: Stanford University, Department of Physics
+=================
+"""
+from PyQt5.QtWidgets import *
+from PyQt5.QtGui import *
+from PyQt5.QtCore import *
+import pyqtgraph as pg
+import numpy as np
+import importlib.util
+import os
+import queue
+import sys
+import threading
+import time
+from ._visa import ResourceScanner, get_rm
+
+# draw the temperature plots through OpenGL when PyOpenGL is installed (optional dependency)
+_HAVE_OPENGL = importlib.util.find_spec("OpenGL") is not None
+
+class TemperatureControl(QFrame):
+    # model -> heater range index (RANGE? reply) -> heater mode label text
+    HEATER_RANGES = {
+        "LS 332": ["Off", "Low", "Med", "High"],
+        "LS 340": ["Off", "Range 1", "Range 2", "Range 3", "Range 4", "Range 5"],
+    }
+    CHANNELS = "ABCD"
+    # (reading key, attribute, title, initial text, row, column) of the readout panel
+    READOUT_TILES = [
+        ("A", "A_num_lb", "A", "0 K", 0, 0),
+        ("B", "B_num_lb", "B", "0 K", 0, 1),
+        ("C", "C_num_lb", "C", "0 K", 1, 0),
+        ("D", "D_num_lb", "D", "0 K", 1, 1),
+        ("S", "S_num_lb", "S", "0 K", 2, 0),
+        ("range", "heater_mode_lb", "Heater", "High", 2, 1),
+    ]
+    _format_temp = "{:.3f} K".format
+    # number of samples shown in each temperature trace
+    TEMPERATURE_PLOT_POINTS = 2000
+    # shortest time between two redraws of the readouts and plots (~30 Hz)
+    REFRESH_MS = 33
+    # one stylesheet for the whole frame, parsed once instead of per widget
+    STYLE_SHEET = """
+        QLabel[role='display'] { border: 1px solid black; }
+        QWidget#RightGridWidget { border: 1px solid rgb(255, 0, 0); }
+        QWidget#RampSettingWidget { border: 1px solid black; }
+        QProgressBar#HeaterBar::chunk { background-color: red; }
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.setGeometry(500, 500, 1600, 800)
+        self.res = None
+        self._poll_thread = None
+        self._poller = None
+        self._logger = None
+        self._last_logged = 0.0
+        self.initUI()
+        self.show()
+
+    def initUI(self):
+        # build everything before the first layout/paint pass
+        self.setUpdatesEnabled(False)
+
+        # create main grid to organize layout
+        main_grid = QHBoxLayout()
+        main_grid.setSpacing(10)
+        self.setLayout(main_grid)
+        self.setWindowTitle("Temperature Control")
+        self.setStyleSheet(self.STYLE_SHEET)
+
+        left_vb = QVBoxLayout()
+        top_hb = QHBoxLayout()
+
+        instr_vb = QVBoxLayout()
+
+        connect_hb = QHBoxLayout()
+        connect_vb = QVBoxLayout()
+        self.connect_btn = QPushButton("Connect")
+        self.connect_btn.clicked.connect(self.connect_to_controller)
+        self.connect_ind = QLedIndicator("orange")
+        connect_vb.addWidget(self.connect_btn)
+        connect_vb.addWidget(self.connect_ind)
+        connect_hb.addLayout(connect_vb)
+
+        model_vb = QVBoxLayout()
+        model_lb = QLabel("Model")
+        self.model_cb = QComboBox()
+        self.model_cb.addItems(["LS 332", "LS 340"])
+        model_vb.addWidget(model_lb)
+        model_vb.addWidget(self.model_cb)
+        connect_hb.addLayout(model_vb)
+        instr_vb.addLayout(connect_hb)
+
+        visa_vb = QVBoxLayout()
+        visa_lb = QLabel("VISA resource name")
+        self.visa_cb = QComboBox()
+        # placeholder until the background scan below reports the real resources
+        self.visa_cb.addItem("Scanning…")
+        self.visa_cb.setEnabled(False)
+        visa_vb.addWidget(visa_lb)
+        visa_vb.addWidget(self.visa_cb)
+        instr_vb.addLayout(visa_vb)
+
+        interval_hb = QHBoxLayout()
+        interval_vb = QVBoxLayout()
+        interval_lb = QLabel("Interval (ms)")
+        self.interval_sb = QSpinBox()
+        # the poller re-arms itself with this delay, so 0 would query back to back
+        self.interval_sb.setMinimum(50)
+        self.interval_sb.setMaximum(1000)
+        self.interval_sb.setValue(500)
+        interval_vb.addWidget(interval_lb)
+        interval_vb.addWidget(self.interval_sb)
+        interval_hb.addLayout(interval_vb)
+
+        sample_temp_vb = QVBoxLayout()
+        sample_temp_lb = QLabel("Sample Temp")
+        self.sample_temp_cb = QComboBox()
+        self.sample_temp_cb.addItems(["A", "B", "C", "D"])
+        sample_temp_vb.addWidget(sample_temp_lb)
+        sample_temp_vb.addWidget(self.sample_temp_cb)
+        interval_hb.addLayout(sample_temp_vb)
+        instr_vb.addLayout(interval_hb)
+        top_hb.addLayout(instr_vb)
+
+        right_grid = QGridLayout()
+        right_grid_widget = QWidget()
+        right_grid_widget.setLayout(right_grid)
+        right_grid_widget.setObjectName("RightGridWidget")
+
+        # title and value label sit directly in the grid cells, two columns per readout
+        right_grid.setContentsMargins(4, 4, 4, 4)
+        right_grid.setSpacing(2)
+        self._readout_labels = {}
+        for key, attr, title, text, row, col in self.READOUT_TILES:
+            title_lb = QLabel(title)
+            value_lb = QLabel(text)
+            value_lb.setProperty('role', 'display')
+            value_lb.setFixedWidth(100)
+            right_grid.addWidget(title_lb, row, 2 * col, Qt.AlignRight | Qt.AlignVCenter)
+            right_grid.addWidget(value_lb, row, 2 * col + 1, Qt.AlignLeft | Qt.AlignVCenter)
+            setattr(self, attr, value_lb)
+            self._readout_labels[key] = value_lb
+        self._temp_labels = {ch: self._readout_labels[ch] for ch in self.CHANNELS}
+        # last text written to each readout, so a steady reading does not touch the widget again
+        self._last = dict.fromkeys(self._readout_labels)
+
+        self.heater_level_pbar = QProgressBar()
+        self.heater_level_pbar.setObjectName("HeaterBar")
+        self.heater_level_pbar.setOrientation(Qt.Vertical)
+        self.heater_level_pbar.setValue(0)
+        self.heater_level_pbar.setMinimumWidth(60)
+        self.heater_level_pbar.setMinimumHeight(250)
+        right_grid.addWidget(self.heater_level_pbar, 0, 4, 3, 1, Qt.AlignCenter)
+        top_hb.addWidget(right_grid_widget)
+        left_vb.addLayout(top_hb)
+
+        ramp_hb = QHBoxLayout()
+
+        loop_vb = QVBoxLayout()
+        loop_lb = QLabel("Loop")
+        self.loop_sb = QSpinBox()
+        self.loop_sb.setValue(1)
+        loop_vb.addWidget(loop_lb)
+        loop_vb.addWidget(self.loop_sb)
+        ramp_hb.addLayout(loop_vb)
+
+        setpoint_vb = QVBoxLayout()
+        setpoint_lb = QLabel("Setpoint (K)")
+        self.setpoint_sb = QDoubleSpinBox()
+        self.setpoint_sb.setValue(4)
+        setpoint_vb.addWidget(setpoint_lb)
+        setpoint_vb.addWidget(self.setpoint_sb)
+        ramp_hb.addLayout(setpoint_vb)
+
+        self.ramp_cb = QCheckBox("Ramp")
+        ramp_hb.addWidget(self.ramp_cb)
+
+        ramp_rate_vb = QVBoxLayout()
+        ramp_rate_lb = QLabel("Ramp Rate (K/min)")
+        self.ramp_rate_sb = QSpinBox()
+        self.ramp_rate_sb.setValue(10)
+        ramp_rate_vb.addWidget(ramp_rate_lb)
+        ramp_rate_vb.addWidget(self.ramp_rate_sb)
+        ramp_hb.addLayout(ramp_rate_vb)
+
+        self.set_ramp_btn = QPushButton("Set")
+        ramp_hb.addWidget(self.set_ramp_btn)
+        left_vb.addLayout(ramp_hb)
+
+        ramp_setting_grid = QGridLayout()
+        ramp_setting_grid_widget = QWidget()
+        ramp_setting_grid_widget.setLayout(ramp_setting_grid)
+        ramp_setting_grid_widget.setObjectName("RampSettingWidget")
+
+        heater_range_vb = QVBoxLayout()
+        heater_range_lb = QLabel("Loop 1 Heater Range")
+        self.heater_range_cb = QComboBox()
+        self.heater_range_cb.addItems(["Off", "Low (0.5W)", "Med (5W)", "High (50W)"])
+        heater_range_vb.addWidget(heater_range_lb)
+        heater_range_vb.addWidget(self.heater_range_cb)
+        ramp_setting_grid.addLayout(heater_range_vb, 0, 0, 1, 1, Qt.AlignCenter)
+
+        manual_output_vb = QVBoxLayout()
+        manual_output_lb = QLabel("Manual Output (%)")
+        self.manual_output_sb = QSpinBox()
+        self.manual_output_sb.setValue(0)
+        manual_output_vb.addWidget(manual_output_lb)
+        manual_output_vb.addWidget(self.manual_output_sb)
+        ramp_setting_grid.addLayout(manual_output_vb, 0, 1, 1, 1, Qt.AlignCenter)
+
+        self.set_PID_btn = QPushButton("Set PID")
+        ramp_setting_grid.addWidget(self.set_PID_btn, 0, 2, 1, 1, Qt.AlignCenter)
+
+        gain_vb = QVBoxLayout()
+        gain_lb = QLabel("Gain (P)")
+        self.gain_sb = QSpinBox()
+        self.gain_sb.setValue(10)
+        gain_vb.addWidget(gain_lb)
+        gain_vb.addWidget(self.gain_sb)
+        ramp_setting_grid.addLayout(gain_vb, 1, 0, 1, 1, Qt.AlignCenter)
+
+        reset_vb = QVBoxLayout()
+        reset_lb = QLabel("Reset (I)")
+        self.reset_sb = QSpinBox()
+        self.reset_sb.setValue(10)
+        reset_vb.addWidget(reset_lb)
+        reset_vb.addWidget(self.reset_sb)
+        ramp_setting_grid.addLayout(reset_vb, 1, 1, 1, 1, Qt.AlignCenter)
+
+        rate_vb = QVBoxLayout()
+        rate_lb = QLabel("Rate (D)")
+        self.rate_sb = QSpinBox()
+        self.rate_sb.setValue(20)
+        rate_vb.addWidget(rate_lb)
+        rate_vb.addWidget(self.rate_sb)
+        ramp_setting_grid.addLayout(rate_vb, 1, 2, 1, 1, Qt.AlignCenter)
+        left_vb.addWidget(ramp_setting_grid_widget)
+
+        temperature_log_hb = QHBoxLayout()
+        self.temperature_log_cb = QCheckBox("Temperature Log to file")
+        self.temperature_log_cb.setChecked(False)
+        self.temperature_log_cb.toggled.connect(self._set_logging)
+        # flush and close an open log on exit
+        QApplication.instance().aboutToQuit.connect(lambda: self._set_logging(False))
+        temperature_log_period_lb = QLabel("Every (s)")
+        self.temperature_log_period_sb = QSpinBox()
+        self.temperature_log_period_sb.setValue(5)
+        temperature_log_hb.addWidget(self.temperature_log_cb)
+        temperature_log_hb.addWidget(temperature_log_period_lb)
+        temperature_log_hb.addWidget(self.temperature_log_period_sb)
+        left_vb.addLayout(temperature_log_hb)
+
+        data_directory_hb = QHBoxLayout()
+        self.select_folder_btn = QPushButton("Select directory")
+        self.select_folder_btn.clicked.connect(self.select_directory)
+        self.data_directory_lb = QLabel()
+        self.data_directory_lb.setProperty('role', 'display')
+        self.data_directory_lb.setMinimumWidth(800)
+        data_directory_hb.addWidget(self.select_folder_btn)
+        data_directory_hb.addWidget(self.data_directory_lb)
+        left_vb.addLayout(data_directory_hb)
+
+        # the plots are only built once there is data to show (see _ensure_plots),
+        # so opening the window does not pay for the plot scene up front
+        self.right_vb = QVBoxLayout()
+        self._plot_slot = QWidget()
+        self.right_vb.addWidget(self._plot_slot)
+        self.plot_area = None
+        self._plots = []
+
+        # fixed-size ring buffers; every sample is stored twice so the latest
+        # TEMPERATURE_PLOT_POINTS values are always one contiguous slice (no roll/concatenate).
+        # Kept as separate arrays (float64 time, one float32 row per channel) rather than a
+        # structured record array, whose fields would be strided views instead of contiguous rows
+        n = self.TEMPERATURE_PLOT_POINTS
+        self._plot_t = np.zeros(2 * n, dtype=np.float64)
+        self._plot_y = np.zeros((len(self.CHANNELS), 2 * n), dtype=np.float32)
+        self._plot_idx = 0
+        self._t0 = None
+        self._curves = []
+
+        # newest reading not yet shown, painted by a coarse single-shot refresh
+        self._latest = None
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setTimerType(Qt.CoarseTimer)
+        self._refresh_timer.setInterval(self.REFRESH_MS)
+        self._refresh_timer.timeout.connect(self._refresh_readouts)
+
+        main_grid.addLayout(left_vb)
+        main_grid.addLayout(self.right_vb)
+
+        # list VISA resources once the window is up instead of blocking construction
+        QTimer.singleShot(0, self._populate_visa)
+        self.setUpdatesEnabled(True)
+
+    def _populate_visa(self):
+        # the shared resource manager is created and enumerated off the GUI thread
+        self._resource_scanner = ResourceScanner()
+        self._resource_scanner.signals.finished.connect(self._set_resources)
+        QThreadPool.globalInstance().start(self._resource_scanner)
+
+    def _set_resources(self, resources):
+        self.visa_cb.clear()
+        self.visa_cb.addItems(resources)
+        self.visa_cb.setEnabled(True)
+
+    def connect_to_controller(self):
+        """Open the temperature controller selected in visa_cb"""
+        if self.res is not None:
+            print("✅ Already connected to temperature controller.")
+            return
+
+        try:
+            self.res = get_rm().open_resource(self.visa_cb.currentText())
+            # the whole compound reply fits in one viRead; Lakeshore terminates replies with CR LF
+            self.res.chunk_size = 64 * 1024
+            self.res.read_termination = "\r\n"
+            self.res.timeout = 2000
+            self.connect_btn.setText("Connected")
+            self.connect_ind.setChecked(True)
+            self.connect_ind.changeColor("green")
+            print("✅ Connected to temperature controller.")
+            self._start_polling()
+        except Exception as e:
+            print("❌ Failed to connect to temperature controller:", e)
+            self.res = None
+            self.connect_btn.setText("Failed")
+            self.connect_ind.setChecked(True)
+            self.connect_ind.changeColor("red")
+
+    def _start_polling(self):
+        # the poller owns the resource from here on, so VISA I/O never blocks the GUI thread
+        self._poll_thread = QThread(self)
+        self._poller = TemperaturePoller(self.res, self.interval_sb.value())
+        self._poller.moveToThread(self._poll_thread)
+        self._poll_thread.started.connect(self._poller.poll)
+        # one queued post per tick carrying the whole reading
+        self._poller.sample.connect(self._update_readouts, Qt.QueuedConnection)
+        self.interval_sb.valueChanged.connect(self._poller.setInterval)
+        QApplication.instance().aboutToQuit.connect(self._stop_polling)
+        self._poll_thread.start()
+
+    def _set_logging(self, on):
+        '''start or stop writing readings to a CSV file in the selected directory'''
+        if not on:
+            if self._logger is not None:
+                self._logger.close()
+                self._logger = None
+                print("✅ Temperature log closed.")
+            return
+
+        directory = self.data_directory_lb.text()
+        if not directory:
+            print("⚠️ Select a directory before logging temperatures.")
+            self.temperature_log_cb.blockSignals(True)
+            self.temperature_log_cb.setChecked(False)
+            self.temperature_log_cb.blockSignals(False)
+            return
+
+        path = os.path.join(directory, f"temperature_log_{time.strftime('%Y%m%d_%H%M%S')}.csv")
+        self._logger = TemperatureLogger(path)
+        self._last_logged = 0.0
+        print(f"✅ Logging temperatures to {path}")
+
+    def _stop_polling(self):
+        if self._poll_thread is None:
+            return
+        self._poller.stop()
+        self._poll_thread.quit()
+        self._poll_thread.wait()
+        self._poll_thread = None
+
+    def shutdown(self):
+        '''stop the poll thread, close the log and release the controller before this window is thrown away'''
+        self._stop_polling()
+        self._set_logging(False)
+        if self.res is not None:
+            self.res.close()
+            self.res = None
+
+    def _ensure_plots(self):
+        '''swap the placeholder for the temperature plots on first use'''
+        if self.plot_area is not None:
+            return
+        # one scene holding a plot per channel, all sharing the time axis
+        self.plot_area = pg.GraphicsLayoutWidget()
+        self.plot_area.setBackground('w')  # White background
+        if _HAVE_OPENGL:
+            self.plot_area.useOpenGL(True)
+        for row, channel in enumerate(self.CHANNELS):
+            plot = self.plot_area.addPlot(row=row, col=0)
+            plot.setMenuEnabled(False)
+            plot.hideButtons()
+            plot.setLabel('left', f"{channel} (K)")
+            if self._plots:
+                plot.setXLink(self._plots[0])
+            self._plots.append(plot)
+            self._curves.append(plot.plot(pen=pg.mkPen('k', width=1)))
+        self._plots[-1].setLabel('bottom', "Time (s)")
+        self.right_vb.replaceWidget(self._plot_slot, self.plot_area)
+        self._plot_slot.deleteLater()
+        self._plot_slot = None
+
+    def _append_plot_sample(self, sample):
+        '''store one reading in the ring buffers'''
+        if self._t0 is None:
+            self._t0 = sample["t"]
+        n = self.TEMPERATURE_PLOT_POINTS
+        i = self._plot_idx % n
+        self._plot_t[i] = self._plot_t[i + n] = sample["t"] - self._t0
+        self._plot_y[:, i] = self._plot_y[:, i + n] = sample["temps"]
+        self._plot_idx += 1
+
+    @pyqtSlot(object)
+    def _update_readouts(self, sample):
+        '''record one reading from the poller; the widgets catch up on the next refresh'''
+        self._append_plot_sample(sample)
+        if self._logger is not None and sample["t"] - self._last_logged >= self.temperature_log_period_sb.value():
+            self._last_logged = sample["t"]
+            self._logger.log((sample["t"], *sample["temps"].tolist(), sample["htr"]))
+
+        # however short the poll interval, labels and plots redraw at most REFRESH_MS apart
+        self._latest = sample
+        if not self._refresh_timer.isActive():
+            self._refresh_timer.start()
+
+    def _refresh_readouts(self):
+        '''show the newest reading and point each curve at the newest window'''
+        # nothing is drawn while hidden; showEvent catches up from the buffers
+        if not self.isVisible():
+            return
+        sample, self._latest = self._latest, None
+        if sample is None:
+            return
+        self._ensure_plots()
+        # format the four temperatures once; the sample readout reuses its channel's text
+        texts = dict(zip(self.CHANNELS, map(self._format_temp, sample["temps"].tolist())))
+        texts["S"] = texts[self.sample_temp_cb.currentText()]
+        ranges = self.HEATER_RANGES.get(self.model_cb.currentText(), ())
+        # a range this table doesn't know is shown as its raw index
+        texts["range"] = ranges[sample["range"]] if 0 <= sample["range"] < len(ranges) else str(sample["range"])
+        for key, label in self._readout_labels.items():
+            if texts[key] != self._last[key]:
+                self._last[key] = texts[key]
+                label.setText(texts[key])
+        level = int(round(sample["htr"]))
+        if level != self.heater_level_pbar.value():
+            self.heater_level_pbar.setValue(level)
+
+        n = self.TEMPERATURE_PLOT_POINTS
+        window = slice(0, self._plot_idx) if self._plot_idx < n else slice(self._plot_idx % n, self._plot_idx % n + n)
+        # copies, since the ring buffers keep filling between this refresh and the next paint
+        t = self._plot_t[window].copy()
+        for curve, y in zip(self._curves, self._plot_y[:, window].copy()):
+            # readings are parsed floats, so pyqtgraph's NaN/inf scan is skipped
+            curve.setData(t, y, skipFiniteCheck=True)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._latest is not None:
+            self._refresh_timer.start()
+
+    def select_directory(self):
+        # Open a dialog to select a directory
+        directory = QFileDialog.getExistingDirectory(self, "Select Directory")
+
+        # Update the label to show the selected directory
+        if directory:
+            self.data_directory_lb.setText(f"{directory}")
+
+
+class TemperaturePoller(QObject):
+    '''read the Lakeshore controller on a worker thread and emit one reading dict every interval:
+    {"temps": A-D as an array, "htr": heater %, "range": heater range index, "t": read time}'''
+    # (field, query) read from the controller on every update tick
+    POLL_QUERIES = [
+        ("A", "KRDG? A"),
+        ("B", "KRDG? B"),
+        ("C", "KRDG? C"),
+        ("D", "KRDG? D"),
+        ("htr", "HTR?"),
+        ("range", "RANGE?"),
+    ]
+    _POLL_CMD = ";".join(cmd for _, cmd in POLL_QUERIES)
+
+    # object, not dict: a dict signal is converted to a QVariantMap and back on every emit,
+    # while an object signal hands the same Python dict across the thread boundary
+    sample = pyqtSignal(object)
+
+    def __init__(self, res, interval):
+        super().__init__()
+        self.res = res
+        self.interval = interval
+        self._compound_ok = True
+        self._running = True
+
+    @pyqtSlot(int)
+    def setInterval(self, interval):
+        self.interval = interval
+
+    def stop(self):
+        self._running = False
+
+    @pyqtSlot()
+    def poll(self):
+        if not self._running:
+            return
+
+        try:
+            values = self._query_all()
+            sample = {"temps": values[:4], "htr": float(values[4]), "range": int(values[5]), "t": time.time()}
+        except Exception as e:
+            print(f"❌ Failed to poll temperature controller: {e}")
+        else:
+            self.sample.emit(sample)
+
+        # re-armed here so a slow reply delays the next poll instead of queueing ticks
+        QTimer.singleShot(self.interval, self.poll)
+
+    def _query_all(self):
+        # one compound query per tick instead of a VISA round trip per reading
+        if self._compound_ok:
+            try:
+                reply = self.res.query(self._POLL_CMD)
+            except Exception:
+                # a timed-out reply can still arrive and would answer the next query, so drop it;
+                # the poll fails this tick and the compound form is tried again on the next
+                self.res.clear()
+                raise
+            try:
+                # numpy parses the whole ';'-separated reply in C; non-numeric replies raise ValueError
+                values = np.fromstring(reply, sep=";")
+            except ValueError:
+                values = ()
+            if len(values) == len(self.POLL_QUERIES):
+                return values
+            # the controller answered, but not with one number per query: it doesn't take the compound form
+            self._compound_ok = False
+            print("⚠️ Polling the temperature controller one query at a time.")
+        return np.array([float(self.res.query(cmd)) for _, cmd in self.POLL_QUERIES])
+
+
+class TemperatureLogger:
+    '''append (time, A, B, C, D, heater) rows to a CSV file from a background thread'''
+    HEADER = "time,A (K),B (K),C (K),D (K),heater (%)\n"
+    FLUSH_PERIOD = 5.0
+
+    def __init__(self, path):
+        self.path = path
+        # bounded so a stalled disk costs old rows, never a blocked GUI thread
+        self._q = queue.Queue(maxsize=4096)
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def log(self, row):
+        while True:
+            try:
+                self._q.put_nowait(row)
+                return
+            except queue.Full:
+                # drop the oldest row to make room
+                try:
+                    self._q.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def close(self):
+        self.log(None)
+        self._thread.join(timeout=2)
+
+    def _run(self):
+        try:
+            with open(self.path, "a", buffering=1 << 20) as f:
+                if f.tell() == 0:
+                    f.write(self.HEADER)
+                last_flush = time.monotonic()
+                while True:
+                    try:
+                        rows = [self._q.get(timeout=0.5)]
+                    except queue.Empty:
+                        rows = []
+                    # take everything that queued up while we were waiting or writing
+                    while True:
+                        try:
+                            rows.append(self._q.get_nowait())
+                        except queue.Empty:
+                            break
+                    done = None in rows
+                    f.writelines("{:.3f},{:.4f},{:.4f},{:.4f},{:.4f},{:.1f}\n".format(*row)
+                                 for row in rows if row is not None)
+                    if done or time.monotonic() - last_flush >= self.FLUSH_PERIOD:
+                        f.flush()
+                        os.fsync(f.fileno())
+                        last_flush = time.monotonic()
+                    if done:
+                        return
+        except OSError as e:
+            print(f"❌ Failed to write temperature log {self.path}: {e}")
+
+
+# from https://github.com/nlamprian/pyqt5-led-indicator-widget/blob/master/LedIndicatorWidget.py
+class QLedIndicator(QAbstractButton):
+    scaledSize = 1000.0
+
+    def __init__(self, color='green', parent=None):  # added a color option to use red or orange
+        QAbstractButton.__init__(self, parent)
+
+        self.setMinimumSize(24, 24)
+        self.setCheckable(True)
+
+        # prevent user from changing indicator color by clicking
+        self.setEnabled(False)
+
+        if color.lower() == 'red':
+            self.on_color_1 = QColor(255, 0, 0)
+            self.on_color_2 = QColor(192, 0, 0)
+            self.off_color_1 = QColor(28, 0, 0)
+            self.off_color_2 = QColor(128, 0, 0)
+        elif color.lower() == 'orange':
+            self.on_color_1 = QColor(255, 175, 0)
+            self.on_color_2 = QColor(170, 115, 0)
+            self.off_color_1 = QColor(90, 60, 0)
+            self.off_color_2 = QColor(150, 100, 0)
+        else:  # default to green if user does not give valid option
+            self.on_color_1 = QColor(0, 255, 0)
+            self.on_color_2 = QColor(0, 192, 0)
+            self.off_color_1 = QColor(0, 28, 0)
+            self.off_color_2 = QColor(0, 128, 0)
+
+        # the bezel gradients and pen never change; the disc gradients follow the color
+        self._pen = QPen(Qt.black)
+        self._pen.setWidth(1)
+        gradient = QRadialGradient(QPointF(-500, -500), 1500, QPointF(-500, -500))
+        gradient.setColorAt(0, QColor(224, 224, 224))
+        gradient.setColorAt(1, QColor(28, 28, 28))
+        self._bezel_outer = QBrush(gradient)
+        gradient = QRadialGradient(QPointF(500, 500), 1500, QPointF(500, 500))
+        gradient.setColorAt(0, QColor(224, 224, 224))
+        gradient.setColorAt(1, QColor(28, 28, 28))
+        self._bezel_inner = QBrush(gradient)
+        # rendered indicator per (checked, size); at most an on and an off image per size
+        self._cache = {}
+        self._buildGradients()
+
+    def changeColor(self, color):
+        '''change color by inputting a string only for red, orange, and green'''
+        if color.lower() == 'red':
+            self.on_color_1 = QColor(255, 0, 0)
+            self.on_color_2 = QColor(192, 0, 0)
+            self.off_color_1 = QColor(28, 0, 0)
+            self.off_color_2 = QColor(128, 0, 0)
+        elif color.lower() == 'orange':
+            self.on_color_1 = QColor(255, 175, 0)
+            self.on_color_2 = QColor(170, 115, 0)
+            self.off_color_1 = QColor(90, 60, 0)
+            self.off_color_2 = QColor(150, 100, 0)
+        elif color.lower() == 'green':
+            self.on_color_1 = QColor(0, 255, 0)
+            self.on_color_2 = QColor(0, 192, 0)
+            self.off_color_1 = QColor(0, 28, 0)
+            self.off_color_2 = QColor(0, 128, 0)
+
+        self._buildGradients()
+        self.update()
+
+    def _buildGradients(self):
+        '''build the on/off disc brushes once per color change instead of on every paint'''
+        gradient = QRadialGradient(QPointF(-500, -500), 1500, QPointF(-500, -500))
+        gradient.setColorAt(0, self.on_color_1)
+        gradient.setColorAt(1, self.on_color_2)
+        self._on_grad = QBrush(gradient)
+        gradient = QRadialGradient(QPointF(500, 500), 1500, QPointF(500, 500))
+        gradient.setColorAt(0, self.off_color_1)
+        gradient.setColorAt(1, self.off_color_2)
+        self._off_grad = QBrush(gradient)
+        self._cache.clear()
+
+    def resizeEvent(self, QResizeEvent):
+        self._cache.clear()
+        self.update()
+
+    def _render(self, realSize, checked):
+        '''draw the LED once into a transparent pixmap of the given size'''
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(int(realSize * ratio), int(realSize * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.translate(realSize / 2, realSize / 2)
+        painter.scale(realSize / self.scaledSize, realSize / self.scaledSize)
+
+        # one pen for all three circles
+        painter.setPen(self._pen)
+        painter.setBrush(self._bezel_outer)
+        painter.drawEllipse(QPoint(0, 0), 500, 500)
+
+        # the inner bezel's edge sits on the near-identical grey of the outer one, so it is
+        # drawn on the fast aliased path; the silhouette and the colored disc stay antialiased
+        painter.setRenderHint(QPainter.Antialiasing, False)
+        painter.setBrush(self._bezel_inner)
+        painter.drawEllipse(QPoint(0, 0), 450, 450)
+
+        painter.setRenderHint(QPainter.Antialiasing, True)
+        painter.setBrush(self._on_grad if checked else self._off_grad)
+        painter.drawEllipse(QPoint(0, 0), 400, 400)
+        painter.end()
+        return pixmap
+
+    def paintEvent(self, QPaintEvent):
+        realSize = min(self.width(), self.height())
+        if realSize <= 0:
+            return
+
+        key = (self.isChecked(), realSize)
+        pixmap = self._cache.get(key)
+        if pixmap is None:
+            if len(self._cache) >= 4:
+                self._cache.clear()
+            pixmap = self._render(realSize, self.isChecked())
+            self._cache[key] = pixmap
+
+        painter = QPainter(self)
+        painter.drawPixmap((self.width() - realSize) // 2, (self.height() - realSize) // 2, pixmap)
+
+    @pyqtProperty(QColor)
+    def onColor1(self):
+        return self.on_color_1
+
+    @onColor1.setter
+    def onColor1(self, color):
+        self.on_color_1 = color
+        self._buildGradients()
+
+    @pyqtProperty(QColor)
+    def onColor2(self):
+        return self.on_color_2
+
+    @onColor2.setter
+    def onColor2(self, color):
+        self.on_color_2 = color
+        self._buildGradients()
+
+    @pyqtProperty(QColor)
+    def offColor1(self):
+        return self.off_color_1
+
+    @offColor1.setter
+    def offColor1(self, color):
+        self.off_color_1 = color
+        self._buildGradients()
+
+    @pyqtProperty(QColor)
+    def offColor2(self):
+        return self.off_color_2
+
+    @offColor2.setter
+    def offColor2(self, color):
+        self.off_color_2 = color
+        self._buildGradients()
+
+
+if __name__ == '__main__':
+    app = QApplication(sys.argv)
+    font = QFont("Calibri")
+    font.setPointSize(14)
+    app.setFont(font)
+    window = TemperatureControl()
+    sys.exit(app.exec_())
\ No newline at end of file
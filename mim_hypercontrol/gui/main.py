@@ -21,12 +21,16 @@ from .controllers.helium_monitor import HeliumMonitor
 from .controllers.temperature_control import TemperatureControl
 from .controllers.magnet_control import MagnetControl
 from .controllers.experiment_control import CreateExperiment
+from .controllers._visa import LockedInstrument, get_rm
 from PyQt5.QtWidgets import *
 from PyQt5.QtGui import *
 from PyQt5.QtCore import *
 from PyQt5 import sip
 import pyqtgraph as pg
+import numpy as np
 import sys
+from collections import deque
+from functools import partial
 import matplotlib
 matplotlib.use("Qt5Agg")
 matplotlib.rcParams['savefig.dpi'] = 600
@@ -37,6 +41,44 @@ import time
 
 
 
+# the one open instance of each tool window class
+_tool_windows = {}
+
+
+def tool_window(cls):
+    '''return the tool window of this class, building it the first time it is asked for'''
+    window = _tool_windows.get(cls)
+    if window is None:
+        window = _tool_windows[cls] = cls()
+    return window
+
+
+def show_tool_window(cls):
+    tool_window(cls).show()
+
+
+def close_tool_windows():
+    '''shut down and close every tool window, so the next tool_window call builds a fresh one'''
+    for window in _tool_windows.values():
+        # stops poll threads and releases VISA sessions before the window is dropped
+        if hasattr(window, 'shutdown'):
+            window.shutdown()
+        window.close()
+    _tool_windows.clear()
+
+
+# decoded icons by file name, so toggling a button doesn't reread the image
+_icons = {}
+
+
+def icon(file_name):
+    '''return the QIcon for file_name, loading it the first time it is asked for'''
+    cached = _icons.get(file_name)
+    if cached is None:
+        cached = _icons[file_name] = QIcon(file_name)
+    return cached
+
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -51,40 +93,25 @@ class MainWindow(QMainWindow):
         self._createMenuBar()
 
     def init_UI(self):
+        # the old main control is deleted with the old splitter, so its poller has to stop first
+        if getattr(self, 'main_widget', None) is not None:
+            self.main_widget.shutdown()
         splitter = QSplitter(Qt.Horizontal)
         self.setCentralWidget(splitter)
 
 
 
 
-        global main_widget
-        global MIM_widget
-        global helium_widget
-        global temperature_widget
-        global magnet_widget
-        global experiment_widget
-
-        MIM_widget = MIMControl()
-        MIM_widget.hide()
-
-        temperature_widget = TemperatureControl()
-        temperature_widget.hide()
-
-        helium_widget = HeliumMonitor()
-        helium_widget.hide()
+        # The MIM, temperature, helium, magnet and experiment windows are built the
+        # first time they are opened (see tool_window); reinitializing starts fresh ones
+        close_tool_windows()
 
         # Remove the signal connection since HeliumMonitor doesn't emit signals anymore
         # helium_widget.helium_level_changed.connect(self.on_helium_level_changed)
 
-        magnet_widget = MagnetControl()
-        magnet_widget.hide()
+        self.main_widget = MainControl()
 
-        experiment_widget = CreateExperiment()
-        experiment_widget.hide()
-
-        main_widget = MainControl()
-
-        splitter.addWidget(main_widget)
+        splitter.addWidget(self.main_widget)
 
         """
         self.show()
@@ -120,16 +147,16 @@ class MainWindow(QMainWindow):
         self.exitAction = QAction("&Exit...", self)
         self.exitAction.triggered.connect(self.exit)
         self.initializeMIM = QAction("&MIM", self)
-        self.initializeMIM.triggered.connect(MIM_widget.show)
+        self.initializeMIM.triggered.connect(partial(show_tool_window, MIMControl))
         self.initializeTransport = QAction("&Transport", self)
         self.initializeLockin = QAction("&Lockin", self)
         self.createExperiment = QAction("&Create Experiment", self)
-        self.createExperiment.triggered.connect(experiment_widget.show)
+        self.createExperiment.triggered.connect(partial(show_tool_window, CreateExperiment))
         self.initializeExperimentControl = QAction("&Experiment Control", self)
         self.initializeExperimentControl.triggered.connect(self.update_experiment_widget)
 
     def update_experiment_widget(self):
-        experiment_widget.experimentControl.show()
+        tool_window(CreateExperiment).experimentControl.show()
 
     def reinitialize(self):
         buttonReply = QMessageBox.question(self, 'Reintialize', "Are you sure to reinitialize everything?", QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
@@ -148,27 +175,58 @@ class MainWindow(QMainWindow):
         app.quit()
 
 class MainControl(QFrame):
+    # samples kept in each time-based plot
+    PLOT_POINTS = 1000
+    # time traces fit their y axis over the first few samples, then hold it until "Fit Y"
+    Y_FIT_SAMPLES = 10
+    # base period of the one single-shot chain that drives all periodic updates
+    TICK_MS = 10
+    # spin box edits are sent once they have settled for this long
+    WRITE_DEBOUNCE_MS = 150
+    # parsed once for the whole window instead of once per widget
+    STYLE_SHEET = """
+        QLabel[role='display'] { border: 1px solid black; }
+        QLabel[role='heading'] { font-weight: bold; }
+        QFrame[role='separator'] { border: 3px dashed gray; }
+        QPushButton[role='arrow'] { text-align: center; }
+    """
+
     def __init__(self):
         super().__init__()
 
         # 222
         self.nanonis = None
         self.attocube = None
+        self._position_thread = None
+        self._position_poller = None
+        # last reading from the position poller, shared by the labels and plots
+        self._latest_sample = None
+        # periodic updates run from one timer: key -> handler, period (s) and next deadline
+        self._tick_handlers = {}
+        self._periods = {}
+        self._next_due = {}
+        # set while the window is hidden or minimized: buffers keep filling but nothing is redrawn
+        self._plots_paused = False
+        # set when the last tick ran past TICK_MS: the right-column traces skip a redraw
+        self._tick_overran = False
         self.connect_to_nanonis()  # Auto-connect to nanonis on initialization
 
         # 222
 
         self.initUI()
 
-        # Add timer to update helium level display
-        self.helium_update_timer = QTimer(self)
-        self.helium_update_timer.timeout.connect(self.update_helium_display)
-        self.helium_update_timer.start(1000)  # Update every second
+        # Update helium level display
+        self._helium_state = None
+        self._add_periodic('helium', self.update_helium_display, 1000)  # Update every second
 
-        # Add timer to update position labels since Nanonis is auto-connected
-        self.position_update_timer = QTimer(self)
-        self.position_update_timer.timeout.connect(self.update_position_labels)
-        self.position_update_timer.start(100)  # Update every 100ms
+        QTimer.singleShot(self.TICK_MS, self._on_tick)
+
+        # Position readouts come from a poller thread since Nanonis is auto-connected
+        if self.nanonis:
+            self._start_position_polling()
+        else:
+            for label in (self.X1_num_lb, self.Y1_num_lb, self.Z1_num_lb, self.Z_controller_position_lb):
+                label.setText("Not Connected")
 
         # Track current encoder axis to avoid unnecessary digital line updates
         self.current_encoder_axis = "X"  # Default to X axis
@@ -190,6 +248,7 @@ class MainControl(QFrame):
         main_grid.setSpacing(10)
         self.setLayout(main_grid)
         self.setWindowTitle("MIM Main Control")
+        self.setStyleSheet(self.STYLE_SHEET)
 
         # top display row
         top_display_hb = QHBoxLayout()
@@ -213,7 +272,7 @@ class MainControl(QFrame):
 
         X1_lb = QLabel("X")
         self.X1_num_lb = QLabel()
-        self.X1_num_lb.setStyleSheet("border: 1px solid black;")
+        self.X1_num_lb.setProperty('role', 'display')
         self.X1_num_lb.setFixedWidth(100)
         X1_hb = QHBoxLayout()
         X1_hb.addWidget(X1_lb)
@@ -222,7 +281,7 @@ class MainControl(QFrame):
 
         Y1_lb = QLabel("Y")
         self.Y1_num_lb = QLabel()
-        self.Y1_num_lb.setStyleSheet("border: 1px solid black;")
+        self.Y1_num_lb.setProperty('role', 'display')
         self.Y1_num_lb.setFixedWidth(100)
         Y1_hb = QHBoxLayout()
         Y1_hb.addWidget(Y1_lb)
@@ -231,7 +290,7 @@ class MainControl(QFrame):
 
         Z1_lb = QLabel("Z")
         self.Z1_num_lb = QLabel()
-        self.Z1_num_lb.setStyleSheet("border: 1px solid black;")
+        self.Z1_num_lb.setProperty('role', 'display')
         self.Z1_num_lb.setFixedWidth(100)
         Z1_hb = QHBoxLayout()
         Z1_hb.addWidget(Z1_lb)
@@ -240,7 +299,7 @@ class MainControl(QFrame):
 
         X2_lb = QLabel("X")
         self.X2_num_lb = QLabel()
-        self.X2_num_lb.setStyleSheet("border: 1px solid black;")
+        self.X2_num_lb.setProperty('role', 'display')
         self.X2_num_lb.setFixedWidth(100)
         X2_hb = QHBoxLayout()
         X2_hb.addWidget(X2_lb)
@@ -249,7 +308,7 @@ class MainControl(QFrame):
 
         Y2_lb = QLabel("Y")
         self.Y2_num_lb = QLabel()
-        self.Y2_num_lb.setStyleSheet("border: 1px solid black;")
+        self.Y2_num_lb.setProperty('role', 'display')
         self.Y2_num_lb.setFixedWidth(100)
         Y2_hb = QHBoxLayout()
         Y2_hb.addWidget(Y2_lb)
@@ -258,7 +317,7 @@ class MainControl(QFrame):
 
         Z2_lb = QLabel("Z")
         self.Z2_num_lb = QLabel()
-        self.Z2_num_lb.setStyleSheet("border: 1px solid black;")
+        self.Z2_num_lb.setProperty('role', 'display')
         self.Z2_num_lb.setFixedWidth(100)
         Z2_hb = QHBoxLayout()
         Z2_hb.addWidget(Z2_lb)
@@ -267,7 +326,7 @@ class MainControl(QFrame):
 
         TControl_hb = QHBoxLayout()
         self.TControl_btn = QPushButton("T Ctrl")
-        self.TControl_btn.clicked.connect(temperature_widget.show)
+        self.TControl_btn.clicked.connect(partial(show_tool_window, TemperatureControl))
         self.TControl_ind = QLedIndicator('orange')
         TControl_hb.addWidget(self.TControl_btn)
         TControl_hb.addWidget(self.TControl_ind)
@@ -275,7 +334,7 @@ class MainControl(QFrame):
 
         T_Sample_lb = QLabel("Sample")
         self.T_Sample_num_lb = QLabel("0 K")
-        self.T_Sample_num_lb.setStyleSheet("border: 1px solid black;")
+        self.T_Sample_num_lb.setProperty('role', 'display')
         self.T_Sample_num_lb.setFixedWidth(100)
         T_Sample_hb = QHBoxLayout()
         T_Sample_hb.addWidget(T_Sample_lb)
@@ -292,7 +351,7 @@ class MainControl(QFrame):
 
         A_lb = QLabel("A")
         self.A_num_lb = QLabel("0 K")
-        self.A_num_lb.setStyleSheet("border: 1px solid black;")
+        self.A_num_lb.setProperty('role', 'display')
         self.A_num_lb.setFixedWidth(100)
         A_hb = QHBoxLayout()
         A_hb.addWidget(A_lb)
@@ -301,7 +360,7 @@ class MainControl(QFrame):
 
         B_lb = QLabel("B")
         self.B_num_lb = QLabel("0 K")
-        self.B_num_lb.setStyleSheet("border: 1px solid black;")
+        self.B_num_lb.setProperty('role', 'display')
         self.B_num_lb.setFixedWidth(100)
         B_hb = QHBoxLayout()
         B_hb.addWidget(B_lb)
@@ -310,7 +369,7 @@ class MainControl(QFrame):
 
         He_lb = QLabel("He")
         self.He_num_lb = QLabel("0 in")
-        self.He_num_lb.setStyleSheet("border: 1px solid black;")
+        self.He_num_lb.setProperty('role', 'display')
         self.He_num_lb.setFixedWidth(100)
         He_hb = QHBoxLayout()
         He_hb.addWidget(He_lb)
@@ -319,7 +378,7 @@ class MainControl(QFrame):
 
         Magnet_hb = QHBoxLayout()
         self.Magnet_btn = QPushButton("Magnet")
-        self.Magnet_btn.clicked.connect(magnet_widget.show)
+        self.Magnet_btn.clicked.connect(partial(show_tool_window, MagnetControl))
         self.Magnet_ind = QLedIndicator('orange')
         Magnet_hb.addWidget(self.Magnet_btn)
         Magnet_hb.addWidget(self.Magnet_ind)
@@ -327,7 +386,7 @@ class MainControl(QFrame):
 
         Magnet_I_lb = QLabel("I")
         self.Magnet_I_num_lb = QLabel("0 A")
-        self.Magnet_I_num_lb.setStyleSheet("border: 1px solid black;")
+        self.Magnet_I_num_lb.setProperty('role', 'display')
         self.Magnet_I_num_lb.setFixedWidth(100)
         Magnet_I_hb = QHBoxLayout()
         Magnet_I_hb.addWidget(Magnet_I_lb)
@@ -336,7 +395,7 @@ class MainControl(QFrame):
 
         Magnet_B_lb = QLabel("B")
         self.Magnet_B_num_lb = QLabel("0 T")
-        self.Magnet_B_num_lb.setStyleSheet("border: 1px solid black;")
+        self.Magnet_B_num_lb.setProperty('role', 'display')
         self.Magnet_B_num_lb.setFixedWidth(100)
         Magnet_B_hb = QHBoxLayout()
         Magnet_B_hb.addWidget(Magnet_B_lb)
@@ -347,13 +406,13 @@ class MainControl(QFrame):
         line = QFrame()
         line.setFrameShape(QFrame.VLine)  # Horizontal line
         line.setFrameShadow(QFrame.Plain)
-        line.setStyleSheet("border: 3px dashed gray;")
+        line.setProperty('role', 'separator')
 
         # Add a dashed line separator
         line2 = QFrame()
         line2.setFrameShape(QFrame.VLine)  # Horizontal line
         line2.setFrameShadow(QFrame.Plain)
-        line2.setStyleSheet("border: 3px dashed gray;")
+        line2.setProperty('role', 'separator')
 
         top_display_hb.addLayout(scanner_display_grid)
         top_display_hb.addWidget(line)
@@ -366,7 +425,7 @@ class MainControl(QFrame):
         self.select_folder_btn = QPushButton("Select directory")
         self.select_folder_btn.clicked.connect(self.select_directory)
         self.data_directory_lb = QLabel()
-        self.data_directory_lb.setStyleSheet("border: 1px solid black;")
+        self.data_directory_lb.setProperty('role', 'display')
         self.data_directory_lb.setFixedWidth(1000)
         update_interval_vb = QVBoxLayout()
         update_interval_lb = QLabel("Update interval (ms)")
@@ -383,9 +442,9 @@ class MainControl(QFrame):
 
         Z_controller_hb = QHBoxLayout()
         Z_controller_name_lb = QLabel("Z Controller")
-        Z_controller_name_lb.setStyleSheet("font-weight: bold;")
+        Z_controller_name_lb.setProperty('role', 'heading')
         self.Z_controller_position_lb = QLabel("0.0 nm")
-        self.Z_controller_position_lb.setStyleSheet("border: 1px solid black;")
+        self.Z_controller_position_lb.setProperty('role', 'display')
         self.Z_controller_position_lb.setFixedWidth(100)
         Z_controller_hb.addWidget(Z_controller_name_lb)
         Z_controller_hb.addWidget(self.Z_controller_position_lb)
@@ -405,9 +464,9 @@ class MainControl(QFrame):
 
         Z_controller_withdraw_hb = QHBoxLayout()
         self.withdraw_btn = QPushButton("Withdraw")
-        self.withdraw_btn.setIcon(QIcon("UpArrow.jpg"))
+        self.withdraw_btn.setIcon(icon("UpArrow.jpg"))
         self.withdraw_btn.setIconSize(self.withdraw_btn.sizeHint())
-        self.withdraw_btn.setStyleSheet("text-align: center;")
+        self.withdraw_btn.setProperty('role', 'arrow')
 
         # 222
         self.withdraw_btn.clicked.connect(self.withdraw_tip)
@@ -432,20 +491,20 @@ class MainControl(QFrame):
         self.lift_btn.clicked.connect(self.approach_lift)
         # 222
 
-        self.lift_btn.setIcon(QIcon("DownArrow.jpg"))
+        self.lift_btn.setIcon(icon("DownArrow.jpg"))
         self.lift_btn.setIconSize(self.lift_btn.sizeHint())
-        self.lift_btn.setStyleSheet("text-align: center;")
+        self.lift_btn.setProperty('role', 'arrow')
         tipLift_lb = QLabel("Tip Lift (μm)")
         self.tipLift_sb = QDoubleSpinBox()
         self.tipLift_sb.setDecimals(3)  # 3 decimal places
-        self.tipLift_sb.editingFinished.connect(self.update_tip_lift_to_nanonis)
+        self.tipLift_sb.editingFinished.connect(self._debounced(self.update_tip_lift_to_nanonis))
         tipLift_vb.addWidget(tipLift_lb)
         tipLift_vb.addWidget(self.tipLift_sb)
         delay_vb = QVBoxLayout()
         delay_lb = QLabel("Delay (ms)")
         self.delay_sb = QDoubleSpinBox()
         self.delay_sb.setDecimals(3)  # 3 decimal places
-        self.delay_sb.editingFinished.connect(self.update_delay_to_nanonis)
+        self.delay_sb.editingFinished.connect(self._debounced(self.update_delay_to_nanonis))
         delay_vb.addWidget(delay_lb)
         delay_vb.addWidget(self.delay_sb)
         Z_controller_lift_hb.addWidget(self.lift_btn)
@@ -466,7 +525,7 @@ class MainControl(QFrame):
         self.Z_lowLimit_sb = QDoubleSpinBox()
         self.Z_lowLimit_sb.setRange(-12.0, 12.0)  # Allow range from -12 to +12 micrometers
         self.Z_lowLimit_sb.setDecimals(3)  # Allow precision to 0.001 μm = 1 nm
-        self.Z_lowLimit_sb.editingFinished.connect(self.update_z_low_limit_to_nanonis)
+        self.Z_lowLimit_sb.editingFinished.connect(self._debounced(self.update_z_low_limit_to_nanonis))
         self.fullRange_btn = QPushButton("Full range")
 
         # 222
@@ -509,7 +568,7 @@ class MainControl(QFrame):
         XYZ_positioner_vb = QVBoxLayout()
 
         XYZ_positioner_lb = QLabel("XYZ Positioner")
-        XYZ_positioner_lb.setStyleSheet("font-weight: bold;")
+        XYZ_positioner_lb.setProperty('role', 'heading')
         XYZ_positioner_vb.addWidget(XYZ_positioner_lb)
 
         axis_hb = QHBoxLayout()
@@ -521,7 +580,7 @@ class MainControl(QFrame):
         axis_vb.addWidget(axis_lb)
         axis_vb.addWidget(self.axis_cb)
         self.gnd_lb = QLabel("GND")
-        self.gnd_lb.setStyleSheet("border: 1px solid black;")
+        self.gnd_lb.setProperty('role', 'display')
         self.gnd_btn = QPushButton("GND all")
         self.gnd_btn.clicked.connect(self.gnd_all_axes)
 
@@ -540,7 +599,7 @@ class MainControl(QFrame):
         self.frequency_sb.setSingleStep(10.0)
         self.frequency_sb.setDecimals(1)
         self.frequency_sb.setValue(1000.0)  # Default
-        self.frequency_sb.editingFinished.connect(self.update_frequency_to_attocube)
+        self.frequency_sb.editingFinished.connect(self._debounced(self.update_frequency_to_attocube))
         # 222
 
         frequency_vb.addWidget(frequency_lb)
@@ -564,15 +623,15 @@ class MainControl(QFrame):
         self.voltage_sb.setSingleStep(0.1)
         self.voltage_sb.setDecimals(1)
         self.voltage_sb.setValue(50.0)  # Default
-        self.voltage_sb.editingFinished.connect(self.update_voltage_to_attocube)
+        self.voltage_sb.editingFinished.connect(self._debounced(self.update_voltage_to_attocube))
         # 222
 
         voltage_vb.addWidget(voltage_lb)
         voltage_vb.addWidget(self.voltage_sb)
         self.direction_btn = QPushButton("Up")
-        self.direction_btn.setIcon(QIcon("UpArrow.jpg"))
+        self.direction_btn.setIcon(icon("UpArrow.jpg"))
         self.direction_btn.setIconSize(self.direction_btn.sizeHint())
-        self.direction_btn.setStyleSheet("text-align: center;")
+        self.direction_btn.setProperty('role', 'arrow')
         self.direction_btn.clicked.connect(self.toggle_upDown)
         positioner_setting2_hb.addLayout(voltage_vb)
         positioner_setting2_hb.addWidget(self.direction_btn)
@@ -645,7 +704,6 @@ class MainControl(QFrame):
         mim_plot_interval_label = QLabel("Update interval (ms):")
         self.mim_plot_value_label = QLabel("Current Value: --")
         self.mim_plot_clear_btn = QPushButton("Clear")
-        self.mim_plot_clear_btn.clicked.connect(lambda: self.clear_plot(self.MIM_plot, 'mim_plot_buffer'))
         mim_plot_controls_hb.addWidget(mim_plot_interval_label)
         mim_plot_controls_hb.addWidget(self.mim_plot_interval_sb)
         mim_plot_controls_hb.addWidget(self.mim_plot_value_label)
@@ -671,23 +729,31 @@ class MainControl(QFrame):
         axis_selector_hb.addWidget(mim_channel_label)
         axis_selector_hb.addWidget(self.mim_channel_cb)
 
-        self.plot_axis_cb.currentIndexChanged.connect(self.update_mim_plot)
-        self.mim_channel_cb.currentIndexChanged.connect(self.update_mim_plot)
+        # the periodic updates read the selections from here instead of asking the combo boxes
+        self.plot_selection = PlotSelection(self.plot_axis_cb.currentText(), self.mim_channel_cb.currentText())
+        self.plot_axis_cb.currentTextChanged.connect(partial(setattr, self.plot_selection, 'axis'))
+        self.mim_channel_cb.currentTextChanged.connect(partial(setattr, self.plot_selection, 'mim_channel'))
+        self.mim_channel_cb.currentIndexChanged.connect(self._update_signal_subscriptions)
 
         # Create the top plot widget before adding to layout
         self.MIM_plot = pg.PlotWidget()
         self.MIM_plot.setBackground('w')
+        # one curve per plot, created here and only fed new data with setData afterwards
+        self.mim_curve = self.MIM_plot.plot(pen=pg.mkPen('b', width=1))
+        self.mim_plot_clear_btn.clicked.connect(partial(self.clear_plot, self.MIM_plot, 'mim_plot_buffer'))
+        # titles and axes only change with the selection, not with every update
+        self.label_mim_plot()
+        self.plot_axis_cb.currentTextChanged.connect(self.label_mim_plot)
+        self.mim_channel_cb.currentTextChanged.connect(self.label_mim_plot)
         center_main_grid.addLayout(axis_selector_hb)
         center_main_grid.addLayout(mim_plot_controls_hb)
         center_main_grid.addWidget(self.MIM_plot)
 
         # MIM plot data buffer and timer for time-based updates
-        self.mim_plot_buffer = []  # list of (t, pos, mim_val)
-        self.mim_plot_start_time = time.time()
-        self.mim_plot_timer = QTimer(self)
-        self.mim_plot_timer.timeout.connect(self.update_mim_plot_timed)
-        self.mim_plot_timer.start(self.mim_plot_interval_sb.value())
-        self.mim_plot_interval_sb.valueChanged.connect(lambda val: self.mim_plot_timer.setInterval(val))
+        self.mim_plot_buffer = RingBuffer(self.PLOT_POINTS, 2)  # t -> (pos, mim_val)
+        # plot times come from perf_counter, which never jumps with wall-clock adjustments
+        self.mim_plot_start_time = time.perf_counter()
+        self._add_periodic('mim', self.update_mim_plot_timed, self.mim_plot_interval_sb.value(), self.mim_plot_interval_sb)
         self.plot_axis_cb.currentIndexChanged.connect(self.reset_mim_plot_buffer)
         self.mim_channel_cb.currentIndexChanged.connect(self.reset_mim_plot_buffer)
 
@@ -697,6 +763,8 @@ class MainControl(QFrame):
         encoder_controls_hb = QHBoxLayout()
         self.encoder_axis_cb = QComboBox()
         self.encoder_axis_cb.addItems(["X", "Y", "Z"])
+        self.plot_selection.encoder_axis = self.encoder_axis_cb.currentText()
+        self.encoder_axis_cb.currentTextChanged.connect(partial(setattr, self.plot_selection, 'encoder_axis'))
         encoder_axis_label = QLabel("Encoder Axis:")
         self.encoder_interval_sb = QSpinBox()
         self.encoder_interval_sb.setRange(100, 10000)
@@ -704,26 +772,32 @@ class MainControl(QFrame):
         encoder_interval_label = QLabel("Update interval (ms):")
         self.encoder_value_label = QLabel("Current Value: --")
         self.encoder_clear_btn = QPushButton("Clear")
-        self.encoder_clear_btn.clicked.connect(lambda: self.clear_plot(self.encoder_plot, 'encoder_buffer'))
+        self.encoder_fit_y_btn = QPushButton("Fit Y")
         encoder_controls_hb.addWidget(encoder_axis_label)
         encoder_controls_hb.addWidget(self.encoder_axis_cb)
         encoder_controls_hb.addWidget(encoder_interval_label)
         encoder_controls_hb.addWidget(self.encoder_interval_sb)
         encoder_controls_hb.addWidget(self.encoder_value_label)
+        encoder_controls_hb.addWidget(self.encoder_fit_y_btn)
         encoder_controls_hb.addWidget(self.encoder_clear_btn)
         center_main_grid.addLayout(encoder_controls_hb)
 
         self.encoder_plot = pg.PlotWidget()
         self.encoder_plot.setBackground('w')
+        # time traces only draw the visible span, peak-decimated to the plot's pixel width
+        self.encoder_plot.setDownsampling(auto=True, mode='peak')
+        self.encoder_plot.setClipToView(True)
+        self.encoder_curve = self.encoder_plot.plot(pen=pg.mkPen('g', width=1))
+        self.label_encoder_plot()
+        self.encoder_axis_cb.currentTextChanged.connect(self.label_encoder_plot)
+        self.encoder_clear_btn.clicked.connect(partial(self.clear_plot, self.encoder_plot, 'encoder_buffer'))
         center_main_grid.addWidget(self.encoder_plot)
 
         # Encoder plot data buffer and timer
-        self.encoder_buffer = []  # list of (t, value)
-        self.encoder_start_time = time.time()
-        self.encoder_timer = QTimer(self)
-        self.encoder_timer.timeout.connect(self.update_encoder_plot)
-        self.encoder_timer.start(self.encoder_interval_sb.value())
-        self.encoder_interval_sb.valueChanged.connect(lambda val: self.encoder_timer.setInterval(val))
+        self.encoder_buffer = RingBuffer(self.PLOT_POINTS, 1)  # t -> (value,)
+        self.encoder_start_time = time.perf_counter()
+        self.encoder_fit_y_btn.clicked.connect(partial(self.fit_plot_y, self.encoder_plot, self.encoder_buffer))
+        self._add_periodic('encoder', self.update_encoder_plot, self.encoder_interval_sb.value(), self.encoder_interval_sb)
         self.encoder_axis_cb.currentIndexChanged.connect(self.reset_encoder_buffer)
 
 
@@ -735,8 +809,8 @@ class MainControl(QFrame):
         self.nanonis_plot_start_times = []
         self.nanonis_plot_value_labels = []
         self.nanonis_plot_widgets = []
+        self.nanonis_plot_curves = []
         self.nanonis_plot_interval_sbs = []
-        self.nanonis_plot_timers = []
         for i in range(4):
             controls_hb = QHBoxLayout()
             channel_cb = QComboBox()
@@ -748,25 +822,33 @@ class MainControl(QFrame):
             interval_label = QLabel("Update interval (ms):")
             value_label = QLabel("Current Value: --")
             clear_btn = QPushButton("Clear")
-            clear_btn.clicked.connect(lambda checked, idx=i: self.clear_nanonis_plot(idx))
+            clear_btn.clicked.connect(partial(self.clear_nanonis_plot, i))
+            fit_y_btn = QPushButton("Fit Y")
             controls_hb.addWidget(QLabel(f"Channel {i+1}:") )
             controls_hb.addWidget(channel_cb)
             controls_hb.addWidget(interval_label)
             controls_hb.addWidget(interval_sb)
             controls_hb.addWidget(value_label)
+            controls_hb.addWidget(fit_y_btn)
             controls_hb.addWidget(clear_btn)
             right_main_grid.addLayout(controls_hb)
             plot_widget = pg.PlotWidget()
             plot_widget.setBackground('w')
+            plot_widget.setDownsampling(auto=True, mode='peak')
+            plot_widget.setClipToView(True)
             right_main_grid.addWidget(plot_widget)
             self.nanonis_plot_channel_cbs.append(channel_cb)
-            self.nanonis_plot_buffers.append([])  # Each buffer is a list of (t, value)
-            self.nanonis_plot_start_times.append(time.time())
+            self.plot_selection.nanonis_channels.append(channel_cb.currentText())
+            channel_cb.currentTextChanged.connect(partial(self.plot_selection.nanonis_channels.__setitem__, i))
+            # labelled once the channel list arrives and again on every channel change
+            channel_cb.currentTextChanged.connect(partial(self.label_nanonis_plot, i))
+            self.nanonis_plot_buffers.append(RingBuffer(self.PLOT_POINTS, 1))  # t -> (value,)
+            fit_y_btn.clicked.connect(partial(self.fit_plot_y, plot_widget, self.nanonis_plot_buffers[i]))
+            self.nanonis_plot_start_times.append(time.perf_counter())
             self.nanonis_plot_value_labels.append(value_label)
             self.nanonis_plot_widgets.append(plot_widget)
+            self.nanonis_plot_curves.append(plot_widget.plot(pen=pg.mkPen('b', width=1)))
             self.nanonis_plot_interval_sbs.append(interval_sb)
-            # Timer will be created after nanonis is connected
-            self.nanonis_plot_timers.append(None)
 
         # After connecting to nanonis, populate channel combo boxes
         def populate_nanonis_channel_cbs():
@@ -802,49 +884,38 @@ class MainControl(QFrame):
             def update():
                 if not self.nanonis or not hasattr(self.nanonis, 'signals'):
                     return
-                channel_cb = self.nanonis_plot_channel_cbs[idx]
                 value_label = self.nanonis_plot_value_labels[idx]
                 plot_widget = self.nanonis_plot_widgets[idx]
                 buffer = self.nanonis_plot_buffers[idx]
-                start_time = self.nanonis_plot_start_times[idx]
-                channel_name = channel_cb.currentText()
-                if channel_name not in self.nanonis.signals:
+                channel_name = self.plot_selection.nanonis_channels[idx]
+                # read by the position poller as part of its one batched request per tick
+                sample = self._latest_sample
+                value = None if sample is None else sample["signals"].get(channel_name)
+                if value is None:
                     value_label.setText("Current Value: --")
                     return
-                try:
-                    index = self.nanonis.signals.index(channel_name)
-                    value = self.nanonis.sig_val_get_by_index(index)
-                except Exception as e:
-                    value_label.setText("Current Value: --")
+                t = time.perf_counter() - self.nanonis_plot_start_times[idx]
+                buffer.append(t, value)
+                if self._plots_paused:
                     return
-                t = time.time() - self.nanonis_plot_start_times[idx]
-                buffer.append((t, value))
-                if len(buffer) > 1000:
-                    del buffer[0:len(buffer)-1000]
-                xs, ys = zip(*buffer) if buffer else ([],[])
-                plot_widget.clear()
-                plot_widget.plot(xs, ys, pen='b')
-                plot_widget.setLabel("bottom", "Time", units="s")
-                plot_widget.setLabel("left", channel_name, units=self.get_axis_units(channel_name))
-                self.configure_plot_appearance(plot_widget, channel_name)
+                if not self._tick_overran:
+                    # the buffer keeps the sample, so the next redraw catches up
+                    self._scroll_trace(plot_widget, self.nanonis_plot_curves[idx], buffer)
                 value_label.setText(self.format_value_with_units(value, channel_name))
             return update
 
-        # Set up timers and channel change logic
-        for i in range(4):
-            update_fn = make_update_fn(i)
-            timer = QTimer(self)
-            timer.timeout.connect(update_fn)
-            timer.start(self.nanonis_plot_interval_sbs[i].value())
-            self.nanonis_plot_interval_sbs[i].valueChanged.connect(lambda val, idx=i: self.nanonis_plot_timers[idx].setInterval(val))
-            self.nanonis_plot_channel_cbs[i].currentIndexChanged.connect(lambda _, idx=i: self.reset_nanonis_plot_buffer(idx))
-            self.nanonis_plot_timers[i] = timer
-
         def reset_nanonis_plot_buffer(idx):
             self.nanonis_plot_buffers[idx].clear()
-            self.nanonis_plot_start_times[idx] = time.time()
+            self.nanonis_plot_start_times[idx] = time.perf_counter()
         self.reset_nanonis_plot_buffer = reset_nanonis_plot_buffer
 
+        # Set up periodic updates and channel change logic
+        for i in range(4):
+            interval_sb = self.nanonis_plot_interval_sbs[i]
+            self._add_periodic(f'nanonis{i}', make_update_fn(i), interval_sb.value(), interval_sb)
+            self.nanonis_plot_channel_cbs[i].currentIndexChanged.connect(partial(self.reset_nanonis_plot_buffer, i))
+            self.nanonis_plot_channel_cbs[i].currentIndexChanged.connect(self._update_signal_subscriptions)
+
         main_grid.addLayout(top_display_hb)
         main_grid.addLayout(data_directory_hb)
         # After defining left_main_grid, center_main_grid, right_main_grid
@@ -855,6 +926,89 @@ class MainControl(QFrame):
 
         main_grid.addLayout(bottom_main_grid)
 
+    def _add_periodic(self, key, handler, interval_ms, interval_sb=None):
+        '''run handler every interval_ms from the shared tick, following interval_sb if given'''
+        self._tick_handlers[key] = handler
+        self._set_period(key, interval_ms)
+        if interval_sb is not None:
+            interval_sb.valueChanged.connect(partial(self._set_period, key))
+
+    def _debounced(self, handler):
+        '''return a slot that runs handler once it has gone WRITE_DEBOUNCE_MS without being called again'''
+        timer = QTimer(self)
+        timer.setSingleShot(True)
+        timer.setInterval(self.WRITE_DEBOUNCE_MS)
+        timer.timeout.connect(handler)
+        # start() on a running timer restarts it, so a burst of edits ends in one write
+        return timer.start
+
+    def _set_period(self, key, interval_ms):
+        self._periods[key] = interval_ms / 1000
+        self._next_due[key] = time.perf_counter() + self._periods[key]
+
+    def _on_tick(self):
+        start = now = time.perf_counter()
+        self._drain_position_samples()
+        for key, due in self._next_due.items():
+            if now < due:
+                continue
+            self._tick_handlers[key]()
+            # stepped from the deadline so the rate doesn't drift, but never
+            # scheduled in the past after a slow handler
+            due += self._periods[key]
+            self._next_due[key] = due if due > now else now + self._periods[key]
+
+        # re-armed for what is left of the period, so a slow tick shortens the
+        # wait instead of letting timeouts pile up behind it
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        self._tick_overran = elapsed_ms > self.TICK_MS
+        QTimer.singleShot(max(0, int(self.TICK_MS - elapsed_ms)), self._on_tick)
+
+    def hideEvent(self, event):
+        self._plots_paused = True
+        super().hideEvent(event)
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._plots_paused:
+            self._plots_paused = False
+            self._redraw_plots()
+
+    def _redraw_plots(self):
+        '''point every curve at its buffered history after a pause'''
+        if len(self.mim_plot_buffer):
+            _, (positions, mim_values) = self.mim_plot_buffer.window()
+            self.mim_curve.setData(positions, mim_values)
+        if len(self.encoder_buffer):
+            self._scroll_trace(self.encoder_plot, self.encoder_curve, self.encoder_buffer)
+        for plot_widget, curve, buffer in zip(self.nanonis_plot_widgets, self.nanonis_plot_curves, self.nanonis_plot_buffers):
+            if len(buffer):
+                self._scroll_trace(plot_widget, curve, buffer)
+
+    def _scroll_trace(self, plot_widget, curve, buffer):
+        '''draw a time trace with explicit ranges instead of auto-ranging on every update'''
+        xs, (ys,) = buffer.window()
+        curve.setData(xs, ys)
+        # the buffer spans the rolling window, so its end times are the x range
+        plot_widget.setXRange(float(xs[0]), float(xs[-1]), padding=0)
+        if len(buffer) <= self.Y_FIT_SAMPLES:
+            self.fit_plot_y(plot_widget, buffer)
+
+    @staticmethod
+    def fit_plot_y(plot_widget, buffer):
+        '''fit the y axis to the buffered history once; it then stays put while streaming'''
+        if not len(buffer):
+            return
+        _, (ys,) = buffer.window()
+        plot_widget.setYRange(float(ys.min()), float(ys.max()))
+
+    @staticmethod
+    def _set_quietly(widget, value):
+        # values read back from an instrument must not be written straight back to it
+        widget.blockSignals(True)
+        widget.setValue(value)
+        widget.blockSignals(False)
+
     def select_directory(self):
         # Open a dialog to select a directory
         directory = QFileDialog.getExistingDirectory(self, "Select Directory")
@@ -866,12 +1020,10 @@ class MainControl(QFrame):
     def toggle_upDown(self):
         if self.direction_btn.text() == "Up":
             self.direction_btn.setText("Down")
-            self.direction_btn.setIcon(QIcon("DownArrow.jpg"))
-            self.direction_btn.setStyleSheet("text-align: center;")
+            self.direction_btn.setIcon(icon("DownArrow.jpg"))
         else:
             self.direction_btn.setText("Up")
-            self.direction_btn.setIcon(QIcon("UpArrow.jpg"))
-            self.direction_btn.setStyleSheet("text-align: center;")
+            self.direction_btn.setIcon(icon("UpArrow.jpg"))
 
     # 222 Z CONTROLLER FUNCTIONS START
     def connect_to_nanonis(self):
@@ -881,10 +1033,9 @@ class MainControl(QFrame):
             return
 
         try:
-            import pyvisa
             from Nanonis import Nanonis
 
-            rm = pyvisa.ResourceManager()
+            rm = get_rm()
 
             # Try to open and immediately close a test connection to avoid crashing Nanonis
             try:
@@ -894,7 +1045,10 @@ class MainControl(QFrame):
                 raise RuntimeError("Device not reachable") from conn_error
 
             # If that works, we safely create the full Nanonis object
-            self.nanonis = Nanonis(rm, 'TCPIP0::localhost::6501::SOCKET')
+            # (locked, since the position poller thread shares this connection)
+            nanonis = Nanonis(rm, 'TCPIP0::localhost::6501::SOCKET')
+            self._tune_visa_sessions(nanonis)
+            self.nanonis = LockedInstrument(nanonis)
 
             print("✅ Auto-connected to Nanonis.")
 
@@ -904,6 +1058,15 @@ class MainControl(QFrame):
             print("❌ Failed to auto-connect to Nanonis:", e)
             self.nanonis = None
 
+    @staticmethod
+    def _tune_visa_sessions(driver):
+        '''raise the read chunk size of any VISA session an instrument driver opened'''
+        from pyvisa.resources import MessageBasedResource
+        for value in getattr(driver, '__dict__', {}).values():
+            if isinstance(value, MessageBasedResource):
+                # a whole reply per read call instead of the default 20 kB pieces
+                value.chunk_size = 1024 * 1024
+
     def connect_to_scanner(self):
         """Connect to Attocube when scanner button is pressed"""
         if self.attocube is not None:
@@ -931,128 +1094,88 @@ class MainControl(QFrame):
             self.scanner_ind.setChecked(True)
             self.scanner_ind.changeColor("red")
 
-    def update_position_labels(self):
-        if not self.nanonis:
-            # Show "Not Connected" when Nanonis is not available
-            self.X1_num_lb.setText("Not Connected")
-            self.Y1_num_lb.setText("Not Connected")
-            self.Z1_num_lb.setText("Not Connected")
-            self.Z_controller_position_lb.setText("Not Connected")
+    def _start_position_polling(self):
+        # the poller does the Nanonis/Attocube reads, so a slow reply never blocks the GUI thread
+        self._position_thread = QThread(self)
+        self._position_poller = PositionPoller(self.nanonis, self.attocube, 100)  # Update every 100ms
+        self._position_poller.moveToThread(self._position_thread)
+        self._position_thread.started.connect(self._position_poller.poll)
+        self._update_signal_subscriptions()
+        QApplication.instance().aboutToQuit.connect(self._stop_position_polling)
+        self._position_thread.start()
+
+    def _stop_position_polling(self):
+        if self._position_thread is None:
             return
-
-        try:
-            # Get the currently selected encoder axis
-            encoder_axis = self.encoder_axis_cb.currentText() if hasattr(self, 'encoder_axis_cb') else "Z"
-
-            # Get current Z, X, Y positions in meters from Nanonis
-            z_pos = self.nanonis.z_pos_get()
-            x_pos, y_pos = self.nanonis.XY_pos_get()
-
-            # Get scanner voltage signals (in V, convert to mV for display)
-            try:
-                # Try to get scanner X, Y, Z voltage signals from Nanonis
-                if hasattr(self.nanonis, 'signals'):
-                    # Look for scanner voltage signals
-                    x_voltage = 0.0  # Default value
-                    y_voltage = 0.0
-                    z_voltage = 0.0
-
-                    # Debug: Print available signals (first time only)
-                    if not hasattr(self, '_printed_signals'):
-                        print("🔍 Available Nanonis signals:")
-                        for i, signal_name in enumerate(self.nanonis.signals):
-                            print(f"  [{i}] {signal_name}")
-                        self._printed_signals = True
-
-                    # Get encoder value from "LI Demod 1 R (V)" channel
-                    encoder_value = 0.0
-                    if "LI Demod 1 R (V)" in self.nanonis.signals:
-                        index = self.nanonis.signals.index("LI Demod 1 R (V)")
-                        encoder_value = self.nanonis.sig_val_get_by_index(index)
-
-                    # Only update the box corresponding to the selected encoder axis
-                    # Other boxes keep their last displayed values (don't overwrite them)
-                    if encoder_axis == "X":
-                        self.X1_num_lb.setText(f"{encoder_value * 1000:.3f} mV")
-                        # Y1 and Z1 keep their previous values - don't update
-                    elif encoder_axis == "Y":
-                        self.Y1_num_lb.setText(f"{encoder_value * 1000:.3f} mV")
-                        # X1 and Z1 keep their previous values - don't update
-                    elif encoder_axis == "Z":
-                        self.Z1_num_lb.setText(f"{encoder_value * 1000:.3f} mV")
-                        # X1 and Y1 keep their previous values - don't update
-
-                else:
-                    # Fallback if signals not available
-                    self.X1_num_lb.setText("-- mV")
-                    self.Y1_num_lb.setText("-- mV")
-                    self.Z1_num_lb.setText("-- mV")
-
-            except Exception as voltage_error:
-                print(f"❌ Failed to get scanner voltages: {voltage_error}")
-                self.X1_num_lb.setText("-- mV")
-                self.Y1_num_lb.setText("-- mV")
-                self.Z1_num_lb.setText("-- mV")
-
-            # Update positioner position displays (bottom row - X2, Y2, Z2)
-            # These should show current positioner positions, not encoder-axis dependent
-            try:
-                # Get positioner positions from attocube if available
-                if hasattr(self, 'attocube') and self.attocube is not None:
-                    # Try to get actual positioner positions
-                    try:
-                        # These might be different method names - adjust as needed
-                        if hasattr(self.attocube, 'get_position'):
-                            x_pos_um = self.attocube.get_position(4) * 1e6  # Axis 4 = X, convert to μm
-                            y_pos_um = self.attocube.get_position(5) * 1e6  # Axis 5 = Y, convert to μm
-                            z_pos_um = self.attocube.get_position(6) * 1e6  # Axis 6 = Z, convert to μm
-                        elif hasattr(self.attocube, 'PosGet'):
-                            positions = self.attocube.PosGet()  # Might return [x, y, z]
-                            if len(positions) >= 3:
-                                x_pos_um = positions[0] * 1e6
-                                y_pos_um = positions[1] * 1e6
-                                z_pos_um = positions[2] * 1e6
-                            else:
-                                raise Exception("PosGet returned insufficient data")
-                        else:
-                            # Fallback - use scanner positions as approximation
-                            x_pos_um = x_pos * 1e6
-                            y_pos_um = y_pos * 1e6
-                            z_pos_um = z_pos * 1e6
-
-                        # Display positioner positions (bottom row)
-                        self.X2_num_lb.setText(f"{x_pos_um:.3f} μm")
-                        self.Y2_num_lb.setText(f"{y_pos_um:.3f} μm")
-                        self.Z2_num_lb.setText(f"{z_pos_um:.3f} μm")
-
-                    except Exception as pos_error:
-                        print(f"❌ Failed to get positioner positions: {pos_error}")
-                        # Fallback to scanner positions
-                        self.X2_num_lb.setText(f"{x_pos * 1e6:.3f} μm")
-                        self.Y2_num_lb.setText(f"{y_pos * 1e6:.3f} μm")
-                        self.Z2_num_lb.setText(f"{z_pos * 1e6:.3f} μm")
-                else:
-                    # No attocube connection - use scanner positions
-                    self.X2_num_lb.setText(f"{x_pos * 1e6:.3f} μm")
-                    self.Y2_num_lb.setText(f"{y_pos * 1e6:.3f} μm")
-                    self.Z2_num_lb.setText(f"{z_pos * 1e6:.3f} μm")
-
-            except Exception as positioner_error:
-                print(f"❌ Failed to update positioner displays: {positioner_error}")
-                self.X2_num_lb.setText("Error")
-                self.Y2_num_lb.setText("Error")
-                self.Z2_num_lb.setText("Error")
-
-            # Always update Z controller position display in nanometers
-            self.Z_controller_position_lb.setText(f"{z_pos * 1e9:.1f} nm")
-
-        except Exception as e:
-            print("❌ Failed to update positions:", e)
+        self._position_poller.stop()
+        self._position_thread.quit()
+        self._position_thread.wait()
+        self._position_thread = None
+
+    def shutdown(self):
+        '''stop the position poller before this widget is replaced'''
+        self._stop_position_polling()
+
+    def _mim_signal_name(self, channel):
+        if channel in self.nanonis.signals:
+            return channel
+        # Fallback to the MIM-Im/MIM-Re signals if the channel is not found
+        return "MIM-Im (V)" if "Im" in channel else "MIM-Re (V)"
+
+    def _update_signal_subscriptions(self):
+        '''tell the poller which signals the MIM and nanonis plots need on every tick'''
+        if self._position_poller is None or not hasattr(self.nanonis, 'signals'):
+            return
+        channels = [self._mim_signal_name(self.mim_channel_cb.currentText())]
+        channels += [cb.currentText() for cb in self.nanonis_plot_channel_cbs]
+        # swapped as a whole so the poller never sees a half-built list
+        self._position_poller.channels = tuple(channels)
+
+    def _drain_position_samples(self):
+        '''take the newest reading the poller has left since the last tick'''
+        samples = self._position_poller.samples if self._position_poller is not None else None
+        if not samples:
+            return
+        # single consumer, so the deque cannot empty between the check and popleft
+        while samples:
+            sample = samples.popleft()
+        self.update_position_labels(sample)
+
+    def update_position_labels(self, sample):
+        self._latest_sample = sample
+        if sample is None:
             # Show error status
             self.X1_num_lb.setText("Error")
             self.Y1_num_lb.setText("Error")
             self.Z1_num_lb.setText("Error")
             self.Z_controller_position_lb.setText("Error")
+            return
+
+        x_pos, y_pos, z_pos = sample["x"], sample["y"], sample["z"]
+
+        # Only update the box corresponding to the selected encoder axis
+        # Other boxes keep their last displayed values (don't overwrite them)
+        encoder_value = sample["encoder"]
+        if encoder_value is None:
+            # Fallback if signals not available
+            self.X1_num_lb.setText("-- mV")
+            self.Y1_num_lb.setText("-- mV")
+            self.Z1_num_lb.setText("-- mV")
+        else:
+            encoder_label = {"X": self.X1_num_lb, "Y": self.Y1_num_lb, "Z": self.Z1_num_lb}[self.plot_selection.encoder_axis]
+            encoder_label.setText(f"{encoder_value * 1000:.3f} mV")
+
+        # Update positioner position displays (bottom row - X2, Y2, Z2)
+        # These show the attocube positions, falling back to the scanner positions
+        positioner = sample["positioner"]
+        if positioner is None:
+            positioner = (x_pos * 1e6, y_pos * 1e6, z_pos * 1e6)
+        self.X2_num_lb.setText(f"{positioner[0]:.3f} μm")
+        self.Y2_num_lb.setText(f"{positioner[1]:.3f} μm")
+        self.Z2_num_lb.setText(f"{positioner[2]:.3f} μm")
+
+        # Always update Z controller position display in nanometers
+        self.Z_controller_position_lb.setText(f"{z_pos * 1e9:.1f} nm")
 
     def withdraw_tip(self):
         if not self.nanonis:
@@ -1169,7 +1292,7 @@ class MainControl(QFrame):
 
         try:
             current_z = self.nanonis.z_pos_get()  # in meters
-            self.Z_lowLimit_sb.setValue(current_z * 1e6)  # convert to μm
+            self._set_quietly(self.Z_lowLimit_sb, current_z * 1e6)  # convert to μm
             print(f"✅ Set Z low limit to {current_z * 1e6:.2f} μm")
         except Exception as e:
             print("❌ Failed to set Z low limit:", e)
@@ -1221,7 +1344,7 @@ class MainControl(QFrame):
             # Wait for approach to complete by monitoring Z position vs Z low limit
             z_low_limit_m = z_low_limit_um * 1e-6  # Convert μm to m for comparison
             approach_timeout = 30.0  # Maximum wait time in seconds
-            start_time = time.time()
+            start_time = time.perf_counter()
 
             while True:
                 try:
@@ -1234,7 +1357,7 @@ class MainControl(QFrame):
                         break
 
                     # Check for timeout
-                    if time.time() - start_time > approach_timeout:
+                    if time.perf_counter() - start_time > approach_timeout:
                         print(f"⚠️ Approach timeout after {approach_timeout}s - current Z: {current_z_pos*1e6:.3f} μm, target: {z_low_limit_um:.3f} μm")
                         break
 
@@ -1271,7 +1394,7 @@ class MainControl(QFrame):
 
             # Set the standard full range: -3 to +3 μm
             # Always use the standard range regardless of what Nanonis returns
-            self.Z_lowLimit_sb.setValue(-3.0)  # Low limit: -3.0 μm
+            self._set_quietly(self.Z_lowLimit_sb, -3.0)  # Low limit: -3.0 μm
             print("✅ Full Range set: -3.0 μm to +3.0 μm")
 
             # Optional: Try to get the actual limits for debugging
@@ -1399,6 +1522,8 @@ class MainControl(QFrame):
         """Disconnect from Attocube"""
         try:
             if self.attocube is not None:
+                if self._position_poller is not None:
+                    self._position_poller.attocube = None
                 self.attocube.close()
                 self.attocube = None
                 self.scanner_connection_btn.setText("On")
@@ -1415,6 +1540,8 @@ class MainControl(QFrame):
             self.attocube = None
             return
         self._connect_to_attocube_pylablib()
+        if self._position_poller is not None:
+            self._position_poller.attocube = self.attocube
 
     def _connect_to_attocube_pylablib(self):
         """Connect to Attocube using pylablib"""
@@ -1429,7 +1556,7 @@ class MainControl(QFrame):
 
                 # Use pylablib's ANC300 class as per documentation
                 # Add timeout parameter to handle slow connections
-                self.attocube = Attocube.ANC300(port)
+                self.attocube = LockedInstrument(Attocube.ANC300(port))
 
                 # Test the connection - according to pylablib docs, update_available_axes() is called automatically
                 print(f"✅ Connected to Attocube via {port}")
@@ -1650,8 +1777,8 @@ class MainControl(QFrame):
                 volt = axis_defaults[axis]["volt"]  # Use axis-specific default
 
             # Update the spinboxes
-            self.frequency_sb.setValue(freq)
-            self.voltage_sb.setValue(volt)
+            self._set_quietly(self.frequency_sb, freq)
+            self._set_quietly(self.voltage_sb, volt)
 
             # Update GND label based on axis status
             self.update_gnd_label(axis_number)
@@ -1921,93 +2048,39 @@ class MainControl(QFrame):
             # Default formatting
             plot_widget.getAxis('left').setStyle(showValues=True)
 
-    def update_mim_plot(self):
-        if not self.nanonis:
-            return
-        try:
-            axis = self.plot_axis_cb.currentText()
-            channel = self.mim_channel_cb.currentText()
-            z = self.nanonis.z_pos_get() * 1e6
-            x, y = self.nanonis.XY_pos_get()
-            x *= 1e6
-            y *= 1e6
-
-            # Get the selected MIM channel value
-            if channel in self.nanonis.signals:
-                index = self.nanonis.signals.index(channel)
-                mim_val = self.nanonis.sig_val_get_by_index(index)
-            else:
-                # Fallback to old method if channel not found
-                mim_imag, mim_real = self.nanonis.sig_vals_get("MIM-Im (V)", "MIM-Re (V)")
-                if "Im" in channel:
-                    mim_val = mim_imag
-                else:
-                    mim_val = mim_real
-
-            pos = {"X": x, "Y": y, "Z": z}[axis]
-            if not hasattr(self, 'mainplot_data_x'):
-                self.mainplot_data_x = []
-                self.mainplot_data_y = []
-            self.mainplot_data_x.append(pos)
-            self.mainplot_data_y.append(mim_val)
-            self.MIM_plot.clear()
-            self.MIM_plot.plot(self.mainplot_data_x, self.mainplot_data_y, pen='b')
-            self.MIM_plot.setTitle(f"{axis} vs. {channel}")
-            self.MIM_plot.setLabel("bottom", f"{axis} Position", units="μm")
-            self.MIM_plot.setLabel("left", channel, units="V")
-            self.configure_plot_appearance(self.MIM_plot, channel)
-            self.mim_plot_value_label.setText(self.format_value_with_units(mim_val, channel))
-        except Exception as e:
-            print("❌ Failed to update main plot:", e)
-
     def update_mim_plot_timed(self):
         """Time-based update for MIM plot - plots position vs MIM signal with time-based updates"""
         if not self.nanonis:
             return
         try:
-            axis = self.plot_axis_cb.currentText()
-            channel = self.mim_channel_cb.currentText()
-
-            # Get position data
-            z = self.nanonis.z_pos_get() * 1e6
-            x, y = self.nanonis.XY_pos_get()
-            x *= 1e6
-            y *= 1e6
-
-            # Get the selected MIM channel value
-            if channel in self.nanonis.signals:
-                index = self.nanonis.signals.index(channel)
-                mim_val = self.nanonis.sig_val_get_by_index(index)
-            else:
-                # Fallback to old method if channel not found
-                mim_imag, mim_real = self.nanonis.sig_vals_get("MIM-Im (V)", "MIM-Re (V)")
-                if "Im" in channel:
-                    mim_val = mim_imag
-                else:
-                    mim_val = mim_real
+            axis = self.plot_selection.axis
+            channel = self.plot_selection.mim_channel
+
+            # Position and MIM value both come from the position poller's latest reading
+            sample = self._latest_sample
+            mim_val = None if sample is None else sample["signals"].get(self._mim_signal_name(channel))
+            if mim_val is None:
+                return
+            z = sample["z"] * 1e6
+            x = sample["x"] * 1e6
+            y = sample["y"] * 1e6
 
             # Get position value for the selected axis
             pos = {"X": x, "Y": y, "Z": z}[axis]
 
             # Calculate time since start (for buffer management, not plotting)
-            t = time.time() - self.mim_plot_start_time
+            t = time.perf_counter() - self.mim_plot_start_time
 
-            # Add data to buffer
-            self.mim_plot_buffer.append((t, pos, mim_val))
-
-            # Limit buffer size
-            if len(self.mim_plot_buffer) > 1000:
-                del self.mim_plot_buffer[0:len(self.mim_plot_buffer)-1000]
+            # Add data to buffer (the oldest sample drops out once it is full)
+            self.mim_plot_buffer.append(t, pos, mim_val)
+            # keep recording while hidden; showEvent redraws from the buffer
+            if self._plots_paused:
+                return
 
             # Plot position vs MIM signal (X-axis = position, Y-axis = MIM signal)
-            if self.mim_plot_buffer:
-                times, positions, mim_values = zip(*self.mim_plot_buffer)
-                self.MIM_plot.clear()
-                self.MIM_plot.plot(positions, mim_values, pen='b')  # X=positions, Y=mim_values
-                self.MIM_plot.setTitle(f"{axis} Position vs {channel}")
-                self.MIM_plot.setLabel("bottom", f"{axis} Position", units="μm")
-                self.MIM_plot.setLabel("left", channel, units=self.get_axis_units(channel))
-                self.configure_plot_appearance(self.MIM_plot, channel)
+            if len(self.mim_plot_buffer):
+                _, (positions, mim_values) = self.mim_plot_buffer.window()
+                self.mim_curve.setData(positions, mim_values)  # X=positions, Y=mim_values
                 self.mim_plot_value_label.setText(self.format_value_with_units(mim_val, channel))
 
         except Exception as e:
@@ -2016,10 +2089,10 @@ class MainControl(QFrame):
     def reset_mim_plot_buffer(self):
         """Reset MIM plot buffer when axis or channel changes"""
         self.mim_plot_buffer.clear()
-        self.mim_plot_start_time = time.time()
+        self.mim_plot_start_time = time.perf_counter()
         # Clear the plot
-        if hasattr(self, 'MIM_plot'):
-            self.MIM_plot.clear()
+        if hasattr(self, 'mim_curve'):
+            self.mim_curve.setData([], [])
 
     def update_mim_plot2(self):
         # Update self.mim_plot2_value_label with the current value
@@ -2070,7 +2143,7 @@ class MainControl(QFrame):
             return
         try:
             # Get the selected axis
-            axis = self.encoder_axis_cb.currentText()
+            axis = self.plot_selection.encoder_axis
 
             # Only set digital lines if axis has changed
             if axis != self.current_encoder_axis:
@@ -2081,14 +2154,16 @@ class MainControl(QFrame):
 
             # Read from "LI Demod 1 R (V)" channel instead of position
             try:
-                # Get the index of "LI Demod 1 R (V)" in the signals list
+                # "LI Demod 1 R (V)" is read by the position poller on every tick
                 if hasattr(self.nanonis, 'signals') and "LI Demod 1 R (V)" in self.nanonis.signals:
-                    index = self.nanonis.signals.index("LI Demod 1 R (V)")
-                    value = self.nanonis.sig_val_get_by_index(index)
+                    if self._latest_sample is None or "LI Demod 1 R (V)" not in self._latest_sample["signals"]:
+                        self.encoder_value_label.setText("Current Value: --")
+                        return
+                    value = self._latest_sample["signals"]["LI Demod 1 R (V)"]
                 else:
                     # Fallback to position if LI Demod channel not available
                     pos = self.nanonis.PosGet()  # [x_pos, y_pos, z_pos]
-                    axis_idx = self.encoder_axis_cb.currentIndex()  # 0=X, 1=Y, 2=Z
+                    axis_idx = "XYZ".index(axis)  # 0=X, 1=Y, 2=Z
                     value = pos[axis_idx]
             except Exception as e:
                 print(f"❌ Failed to read encoder value: {e}")
@@ -2099,24 +2174,42 @@ class MainControl(QFrame):
             self.encoder_value_label.setText("Current Value: --")
             return
 
-        t = time.time() - self.encoder_start_time
-        self.encoder_buffer.append((t, value))
-        if len(self.encoder_buffer) > 1000:
-            del self.encoder_buffer[0:len(self.encoder_buffer)-1000]
-        xs, ys = zip(*self.encoder_buffer) if self.encoder_buffer else ([],[])
-        self.encoder_plot.clear()
-        self.encoder_plot.plot(xs, ys, pen='g')
+        t = time.perf_counter() - self.encoder_start_time
+        self.encoder_buffer.append(t, value)
+        if self._plots_paused:
+            return
+        self._scroll_trace(self.encoder_plot, self.encoder_curve, self.encoder_buffer)
+        self.encoder_value_label.setText(self.format_value_with_units(value, "LI Demod 1 R (V)"))
+
+    def label_mim_plot(self, *_):
+        '''set the MIM plot's title and axis labels for the selected axis and channel'''
+        axis = self.plot_axis_cb.currentText()
+        channel = self.mim_channel_cb.currentText()
+        self.MIM_plot.setTitle(f"{axis} Position vs {channel}")
+        self.MIM_plot.setLabel("bottom", f"{axis} Position", units="μm")
+        self.MIM_plot.setLabel("left", channel, units=self.get_axis_units(channel))
+        self.configure_plot_appearance(self.MIM_plot, channel)
+
+    def label_encoder_plot(self, *_):
+        '''set the encoder plot's axis labels for the selected axis'''
+        axis = self.encoder_axis_cb.currentText()
         self.encoder_plot.setLabel("bottom", "Time", units="s")
         self.encoder_plot.setLabel("left", f"{axis} Encoder", units="V")
         self.configure_plot_appearance(self.encoder_plot, f"{axis} Encoder")
-        self.encoder_value_label.setText(self.format_value_with_units(value, "LI Demod 1 R (V)"))
+
+    def label_nanonis_plot(self, idx, channel_name):
+        '''set a right-hand plot's axis labels for its channel'''
+        plot_widget = self.nanonis_plot_widgets[idx]
+        plot_widget.setLabel("bottom", "Time", units="s")
+        plot_widget.setLabel("left", channel_name, units=self.get_axis_units(channel_name))
+        self.configure_plot_appearance(plot_widget, channel_name)
 
     def reset_encoder_buffer(self):
         self.encoder_buffer.clear()
-        self.encoder_start_time = time.time()
+        self.encoder_start_time = time.perf_counter()
         # Clear the plot when buffer is reset
-        if hasattr(self, 'encoder_plot'):
-            self.encoder_plot.clear()
+        if hasattr(self, 'encoder_curve'):
+            self.encoder_curve.setData([], [])
 
     def update_nanonis_plot1(self):
         self.nanonis_plot1_value_label.setText("Current Value: --")
@@ -2135,22 +2228,19 @@ class MainControl(QFrame):
     def clear_plot(self, plot_widget, buffer_name):
         """Clear a plot and its associated data buffer"""
         try:
-            # Clear the plot widget
-            plot_widget.clear()
+            # Empty the plot's curves (kept, so the next update just calls setData)
+            for curve in plot_widget.listDataItems():
+                curve.setData([], [])
 
             # Clear the associated buffer if it exists
-            if hasattr(self, buffer_name + '_x') and hasattr(self, buffer_name + '_y'):
-                # For mainplot_data (has _x and _y)
-                getattr(self, buffer_name + '_x').clear()
-                getattr(self, buffer_name + '_y').clear()
-            elif hasattr(self, buffer_name):
+            if hasattr(self, buffer_name):
                 # For encoder_buffer and mim_plot_buffer (single buffer)
                 getattr(self, buffer_name).clear()
                 # Reset start time for time-based plots
                 if buffer_name == 'encoder_buffer':
-                    self.encoder_start_time = time.time()
+                    self.encoder_start_time = time.perf_counter()
                 elif buffer_name == 'mim_plot_buffer':
-                    self.mim_plot_start_time = time.time()
+                    self.mim_plot_start_time = time.perf_counter()
             print(f"✅ Cleared {buffer_name} plot")
         except Exception as e:
             print(f"❌ Failed to clear plot: {e}")
@@ -2159,12 +2249,12 @@ class MainControl(QFrame):
         """Clear a specific nanonis plot and its buffer"""
         try:
             if 0 <= plot_index < len(self.nanonis_plot_widgets):
-                # Clear the plot widget
-                self.nanonis_plot_widgets[plot_index].clear()
+                # Empty the plot's curve
+                self.nanonis_plot_curves[plot_index].setData([], [])
                 # Clear the buffer
                 self.nanonis_plot_buffers[plot_index].clear()
                 # Reset start time
-                self.nanonis_plot_start_times[plot_index] = time.time()
+                self.nanonis_plot_start_times[plot_index] = time.perf_counter()
                 print(f"✅ Cleared nanonis plot {plot_index + 1}")
         except Exception as e:
             print(f"❌ Failed to clear nanonis plot {plot_index + 1}: {e}")
@@ -2172,30 +2262,176 @@ class MainControl(QFrame):
     def update_helium_display(self):
         """Update the helium level display in the main control"""
         try:
-            # Check if helium monitor is connected and active
+            # Check if helium monitor is open, connected and active
+            helium_widget = _tool_windows.get(HeliumMonitor)
             if hasattr(helium_widget, 'is_connected') and helium_widget.is_connected():
                 helium_level = helium_widget.get_current_helium_level()
                 if helium_level is not None:
-                    self.He_num_lb.setText(f"{helium_level:.2f} in")
-                    self.Helium_ind.setChecked(True)
-                    self.Helium_ind.changeColor("green")
+                    state = (f"{helium_level:.2f} in", True, "green")
                 else:
-                    self.He_num_lb.setText("--")
-                    self.Helium_ind.setChecked(True)
-                    self.Helium_ind.changeColor("orange")
+                    state = ("--", True, "orange")
             else:
-                self.He_num_lb.setText("--")
-                self.Helium_ind.setChecked(False)
-                self.Helium_ind.changeColor("orange")
+                state = ("--", False, "orange")
         except Exception as e:
             print("❌ Failed to update helium display:", e)
-            self.He_num_lb.setText("--")
-            self.Helium_ind.setChecked(True)
-            self.Helium_ind.changeColor("red")
+            state = ("--", True, "red")
+
+        # the level changes slowly, so most ticks leave the label and LED untouched
+        if state == self._helium_state:
+            return
+        self._helium_state = state
+        text, checked, color = state
+        self.He_num_lb.setText(text)
+        self.Helium_ind.setChecked(checked)
+        self.Helium_ind.changeColor(color)
 
     def show_helium_monitor(self):
         """Show the HeliumMonitor widget."""
-        helium_widget.show()
+        show_tool_window(HeliumMonitor)
+
+class PlotSelection:
+    '''the plot combo box choices, kept current by their currentTextChanged signals'''
+    __slots__ = ("axis", "mim_channel", "encoder_axis", "nanonis_channels")
+
+    def __init__(self, axis, mim_channel, encoder_axis="X"):
+        self.axis = axis
+        self.mim_channel = mim_channel
+        self.encoder_axis = encoder_axis
+        self.nanonis_channels = []
+
+
+class RingBuffer:
+    '''fixed-size plot history: a float64 time column plus `width` float32 value rows,
+    where appending past capacity drops the oldest sample'''
+    def __init__(self, capacity, width):
+        self.capacity = capacity
+        # every sample is stored at i and i + capacity, so the last `capacity`
+        # samples are always one contiguous slice (no roll/concatenate)
+        self._t = np.zeros(2 * capacity, dtype=np.float64)
+        self._y = np.zeros((width, 2 * capacity), dtype=np.float32)
+        self._idx = 0
+
+    def __len__(self):
+        return min(self._idx, self.capacity)
+
+    def append(self, t, *values):
+        n = self.capacity
+        i = self._idx % n
+        self._t[i] = self._t[i + n] = t
+        # scalar stores per row: assigning the tuple to a column builds a temporary array
+        for row, value in enumerate(values):
+            self._y[row, i] = self._y[row, i + n] = value
+        self._idx += 1
+
+    def clear(self):
+        self._idx = 0
+
+    def window(self):
+        '''return (t, rows) for the buffered samples, oldest first'''
+        n = self.capacity
+        start = self._idx % n if self._idx >= n else 0
+        window = slice(start, start + len(self))
+        # copies: pyqtgraph keeps references to the arrays it is given, and later
+        # appends overwrite this window in place
+        return self._t[window].copy(), self._y[:, window].copy()
+
+
+class PositionPoller(QObject):
+    '''read the scanner and positioner positions on a worker thread and queue one reading dict every interval:
+    {"x", "y", "z": scanner position (m), "signals": {name: value} for the subscribed signals,
+     "encoder": LI Demod 1 R (V) or None, "positioner": Attocube X/Y/Z (μm) or None, "t": read time (perf_counter)}'''
+    ENCODER_CHANNEL = "LI Demod 1 R (V)"
+
+    def __init__(self, nanonis, attocube, interval):
+        super().__init__()
+        # readings for the GUI's tick to drain; deque append/popleft are atomic, so the
+        # handoff needs no lock and no queued signal per sample
+        self.samples = deque(maxlen=64)
+        self.nanonis = nanonis
+        # swapped by MainControl when the Attocube is (dis)connected
+        self.attocube = attocube
+        # signal names read on every tick besides the encoder, set by MainControl
+        self.channels = ()
+        self.interval = interval
+        self._printed_signals = False
+        self._batch_ok = True
+        self._running = True
+
+    def stop(self):
+        self._running = False
+
+    @pyqtSlot()
+    def poll(self):
+        if not self._running:
+            return
+
+        try:
+            sample = self._read()
+        except Exception as e:
+            print("❌ Failed to update positions:", e)
+            sample = None
+        self.samples.append(sample)
+
+        # re-armed here so a slow reply delays the next poll instead of queueing ticks
+        QTimer.singleShot(self.interval, self.poll)
+
+    def _read(self):
+        # Get current Z, X, Y positions in meters from Nanonis
+        z_pos = self.nanonis.z_pos_get()
+        x_pos, y_pos = self.nanonis.XY_pos_get()
+        signals = self._read_signals()
+        # the encoder box shows 0 if the channel is missing and "--" if the signals could not be read
+        encoder = None if signals is None else signals.get(self.ENCODER_CHANNEL, 0.0)
+        return {"x": x_pos, "y": y_pos, "z": z_pos, "signals": signals or {}, "encoder": encoder,
+                "positioner": self._read_positioner(), "t": time.perf_counter()}
+
+    def _read_signals(self):
+        if not hasattr(self.nanonis, 'signals'):
+            return None
+        try:
+            available = self.nanonis.signals
+            # Debug: Print available signals (first time only)
+            if not self._printed_signals:
+                print("🔍 Available Nanonis signals:")
+                for i, signal_name in enumerate(available):
+                    print(f"  [{i}] {signal_name}")
+                self._printed_signals = True
+
+            names = [name for name in dict.fromkeys((self.ENCODER_CHANNEL,) + self.channels) if name in available]
+            if not names:
+                return {}
+            # one multi-signal request per tick instead of a round trip per channel
+            if self._batch_ok:
+                # an error here (e.g. a timeout) only fails this tick; batching is given up
+                # only when the driver has no batched read or answers with the wrong count
+                sig_vals_get = getattr(self.nanonis, 'sig_vals_get', None)
+                values = None if sig_vals_get is None else list(sig_vals_get(*names))
+                if values is not None and len(values) == len(names):
+                    return dict(zip(names, values))
+                self._batch_ok = False
+                print("⚠️ Reading Nanonis signals one at a time.")
+            return {name: self.nanonis.sig_val_get_by_index(available.index(name)) for name in names}
+        except Exception as e:
+            print(f"❌ Failed to get scanner voltages: {e}")
+            return None
+
+    def _read_positioner(self):
+        attocube = self.attocube
+        if attocube is None:
+            return None
+        try:
+            # These might be different method names - adjust as needed
+            if hasattr(attocube, 'get_position'):
+                # Axes 4, 5, 6 = X, Y, Z, converted to μm
+                return tuple(attocube.get_position(axis) * 1e6 for axis in (4, 5, 6))
+            if hasattr(attocube, 'PosGet'):
+                positions = attocube.PosGet()  # Might return [x, y, z]
+                if len(positions) < 3:
+                    raise Exception("PosGet returned insufficient data")
+                return tuple(p * 1e6 for p in positions[:3])
+        except Exception as e:
+            print(f"❌ Failed to get positioner positions: {e}")
+        return None
 
 # from https://github.com/nlamprian/pyqt5-led-indicator-widget/blob/master/LedIndicatorWidget.py
 class QLedIndicator(QAbstractButton):
@@ -2319,10 +2555,16 @@ class QLedIndicator(QAbstractButton):
     def offColor2(self, color):
         self.off_color_2 = color
 
-if __name__ == '__main__':
+def main():
+    global app
     app = QApplication(sys.argv)
+    # Calibri is usually missing on Linux; name the metric-compatible fallbacks up front
+    QFont.insertSubstitutions("Calibri", ["Carlito", "DejaVu Sans"])
     font = QFont("Calibri")
     font.setPointSize(14)
     app.setFont(font)
     window = MainWindow()
-    sys.exit(app.exec_())
\ No newline at end of file
+    return app.exec_()
+
+if __name__ == '__main__':
+    sys.exit(main())
\ No newline at end of file
@@ -31,7 +31,7 @@ class Config:
     # === USER-CONFIGURABLE PARAMETERS ===
     
     # Template image path
-    large_image_path: str = 'src/particle_filter/data/ArrowMarker_10x.jpg'
+    large_image_path: str = 'mim_hypercontrol/particle_filter/data/ArrowMarker_10x.jpg'
     
     # Physical calibration (most important parameter)
     Z_HEIGHT: float = 50.0         # Physical height of small tile in micrometers
@@ -24,7 +24,7 @@ setup(
     long_description=read_readme(),
     long_description_content_type="text/markdown",
     url="https://github.com/philipsuh004/mim_hypercontrol",  
-    packages=find_packages(),
+    packages=find_packages(include=["mim_hypercontrol", "mim_hypercontrol.*"]),
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Science/Research",
@@ -47,11 +47,9 @@ setup(
             "flake8>=3.9.0",
         ],
     },
-    entry_points={
-        "console_scripts": [
-            "mim-hypercontrol=src.gui.main:main",
-        ],
-    },
+    # Plain launcher script rather than a console_scripts entry point, whose
+    # generated wrapper imports pkg_resources on every start.
+    scripts=["bin/mim-hypercontrol"],
     include_package_data=True,
     package_data={
         "": ["assets/images/*.jpg", "assets/icons/*"],
@@ -6,11 +6,8 @@ For unit testing without hardware, mock the instrument connections.
 """
 
 import unittest
-import sys
-import os
 
-# Add src to path for imports
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
+import numpy as np
 
 class TestControllers(unittest.TestCase):
     """Test cases for controller classes."""
@@ -22,22 +19,22 @@ class TestControllers(unittest.TestCase):
     def test_import_controllers(self):
         """Test that all controllers can be imported."""
         try:
-            from controllers.mim_control import MIMControl
-            from controllers.temperature_control import TemperatureControl
-            from controllers.magnet_control import MagnetControl
-            from controllers.helium_monitor import HeliumMonitor
-            from controllers.experiment_control import CreateExperiment
+            from mim_hypercontrol.gui.controllers.mim_control import MIMControl
+            from mim_hypercontrol.gui.controllers.temperature_control import TemperatureControl
+            from mim_hypercontrol.gui.controllers.magnet_control import MagnetControl
+            from mim_hypercontrol.gui.controllers.helium_monitor import HeliumMonitor
+            from mim_hypercontrol.gui.controllers.experiment_control import CreateExperiment
         except ImportError as e:
             self.fail(f"Failed to import controllers: {e}")
     
     def test_controller_initialization(self):
         """Test that controllers can be initialized."""
         try:
-            from controllers.mim_control import MIMControl
-            from controllers.temperature_control import TemperatureControl
-            from controllers.magnet_control import MagnetControl
-            from controllers.helium_monitor import HeliumMonitor
-            from controllers.experiment_control import CreateExperiment
+            from mim_hypercontrol.gui.controllers.mim_control import MIMControl
+            from mim_hypercontrol.gui.controllers.temperature_control import TemperatureControl
+            from mim_hypercontrol.gui.controllers.magnet_control import MagnetControl
+            from mim_hypercontrol.gui.controllers.helium_monitor import HeliumMonitor
+            from mim_hypercontrol.gui.controllers.experiment_control import CreateExperiment
             
             # Note: These will create GUI windows, so they should be tested
             # in a headless environment or with proper cleanup
@@ -46,5 +43,88 @@ class TestControllers(unittest.TestCase):
         except Exception as e:
             self.fail(f"Failed to initialize controllers: {e}")
 
+
+class TestRangeParsing(unittest.TestCase):
+    """Test cases for the sweep range parser."""
+
+    def test_parse_range(self):
+        """Test that range specs give the expected number of points."""
+        from mim_hypercontrol.gui.controllers.experiment_procedure import _parse_range
+        start, stop, step, values = _parse_range('range(0, 101, 1)')
+        self.assertEqual((start, stop, step), (0.0, 101.0, 1.0))
+        self.assertEqual(len(values), 101)
+        self.assertEqual(len(_parse_range('range(1, 1.3, 0.1)')[3]), 3)
+        self.assertIsNone(_parse_range('[0, 1, 2]'))
+
+    def test_parse_range_values(self):
+        """Test that range specs step like range(), including a partial last step."""
+        from mim_hypercontrol.gui.controllers.experiment_procedure import _parse_range
+        self.assertEqual(_parse_range('range(0, 10, 3)')[3].tolist(), [0, 3, 6, 9])
+        np.testing.assert_allclose(_parse_range('range(0, 1, 0.3)')[3], [0, 0.3, 0.6, 0.9], rtol=1e-6)
+        self.assertEqual(_parse_range('range(10, 0, -4)')[3].tolist(), [10, 6, 2])
+        self.assertEqual(len(_parse_range('range(5, 0, 1)')[3]), 0)
+        with self.assertRaises(ValueError):
+            _parse_range('range(0, 1, 0)')
+
+
+class TestRingBuffer(unittest.TestCase):
+    """Test cases for the plot history ring buffer."""
+
+    def test_window_wraps_in_order(self):
+        """Test that the window holds the newest samples, oldest first, as copies."""
+        from mim_hypercontrol.gui.main import RingBuffer
+        buffer = RingBuffer(4, 2)
+        for i in range(6):
+            buffer.append(i, 10 * i, -i)
+        self.assertEqual(len(buffer), 4)
+        t, (a, b) = buffer.window()
+        self.assertEqual(t.tolist(), [2, 3, 4, 5])
+        self.assertEqual(a.tolist(), [20, 30, 40, 50])
+        self.assertEqual(b.tolist(), [-2, -3, -4, -5])
+        buffer.append(6, 60, -6)
+        self.assertEqual(t.tolist(), [2, 3, 4, 5])
+        buffer.clear()
+        self.assertEqual(len(buffer.window()[0]), 0)
+
+class _StubResource:
+    """VISA resource stand-in answering queries from a list of replies."""
+
+    def __init__(self, *replies):
+        self.replies = list(replies)
+        self.cleared = 0
+
+    def query(self, cmd):
+        reply = self.replies.pop(0)
+        if isinstance(reply, Exception):
+            raise reply
+        return reply
+
+    def clear(self):
+        self.cleared += 1
+
+
+class TestTemperaturePoller(unittest.TestCase):
+    """Test cases for the temperature poller's compound query."""
+
+    def _poller(self, *replies):
+        from mim_hypercontrol.gui.controllers.temperature_control import TemperaturePoller
+        return TemperaturePoller(_StubResource(*replies), 100)
+
+    def test_timeout_clears_and_raises(self):
+        """Test that a timeout clears the session and keeps the compound query."""
+        poller = self._poller(TimeoutError("timeout"), "1;2;3;4;5;1")
+        with self.assertRaises(TimeoutError):
+            poller._query_all()
+        self.assertEqual(poller.res.cleared, 1)
+        self.assertEqual(poller._query_all().tolist(), [1, 2, 3, 4, 5, 1])
+
+    def test_rejected_compound_query_falls_back(self):
+        """Test that short and non-numeric replies switch to one query per reading."""
+        for reply in ("1;2", "ERR"):
+            poller = self._poller(reply, *["7"] * 6)
+            self.assertEqual(poller._query_all().tolist(), [7] * 6)
+            self.assertFalse(poller._compound_ok)
+
+
 if __name__ == '__main__':
     unittest.main()